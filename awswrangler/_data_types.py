@@ -282,15 +282,25 @@ def pyarrow_types_from_pandas(
         else:
             cols.append(name)
 
-    # Filling cols_dtypes
-    for col in cols:
-        _logger.debug("Inferring PyArrow type from column: %s", col)
+    # Filling cols_dtypes (Single inference pass, falling back to column by column if it fails)
+    inferred: Optional[pa.Schema] = None
+    if cols and df.columns.is_unique:
         try:
-            schema: pa.Schema = pa.Schema.from_pandas(df=df[[col]], preserve_index=False)
-        except pa.ArrowInvalid as ex:  # pragma: no cover
-            cols_dtypes[col] = process_not_inferred_dtype(ex)
-        else:
-            cols_dtypes[col] = schema.field(col).type
+            inferred = pa.Schema.from_pandas(df=df[cols], preserve_index=False)
+        except pa.ArrowInvalid:
+            _logger.debug("Falling back to column by column PyArrow type inference.")
+    if inferred is not None:
+        for col, field in zip(cols, inferred):
+            cols_dtypes[col] = field.type
+    else:
+        for col in cols:
+            _logger.debug("Inferring PyArrow type from column: %s", col)
+            try:
+                schema: pa.Schema = pa.Schema.from_pandas(df=df[[col]], preserve_index=False)
+            except pa.ArrowInvalid as ex:  # pragma: no cover
+                cols_dtypes[col] = process_not_inferred_dtype(ex)
+            else:
+                cols_dtypes[col] = schema.field(col).type
 
     # Filling indexes
     indexes: List[str] = []
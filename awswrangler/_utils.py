@@ -5,6 +5,8 @@ import logging
 import math
 import os
 import random
+import threading
+import weakref
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import boto3  # type: ignore
@@ -17,6 +19,12 @@ from awswrangler import exceptions
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+# Weak keys, so sessions dropped by their callers also release their cached clients (and connection pools)
+_CLIENTS_CACHE: "weakref.WeakKeyDictionary[boto3.Session, Dict[Tuple[str, int], boto3.client]]" = (
+    weakref.WeakKeyDictionary()
+)
+_CLIENTS_CACHE_LOCK: threading.Lock = threading.Lock()
+
 
 def ensure_session(session: Optional[Union[boto3.Session, Dict[str, Optional[str]]]] = None) -> boto3.Session:
     """Ensure that a valid boto3.Session will be returned."""
@@ -55,11 +63,20 @@ def boto3_from_primitives(primitives: Dict[str, Optional[str]] = None) -> boto3.
     return boto3.Session(**args)
 
 
-def client(service_name: str, session: Optional[boto3.Session] = None) -> boto3.client:
-    """Create a valid boto3.client."""
-    return ensure_session(session=session).client(
-        service_name=service_name, use_ssl=True, config=botocore.config.Config(retries={"max_attempts": 15})
-    )
+def client(service_name: str, session: Optional[boto3.Session] = None, max_pool_connections: int = 10) -> boto3.client:
+    """Create a valid boto3 client, cached per boto3 Session."""
+    _session: boto3.Session = ensure_session(session=session)
+    key: Tuple[str, int] = (service_name, max_pool_connections)
+    # boto3 clients are thread safe (unlike sessions), so one client per session/service can be shared.
+    with _CLIENTS_CACHE_LOCK:
+        clients: Dict[Tuple[str, int], boto3.client] = _CLIENTS_CACHE.setdefault(_session, {})
+        if key not in clients:
+            clients[key] = _session.client(
+                service_name=service_name,
+                use_ssl=True,
+                config=botocore.config.Config(retries={"max_attempts": 15}, max_pool_connections=max_pool_connections),
+            )
+        return clients[key]
 
 
 def resource(service_name: str, session: Optional[boto3.Session] = None) -> boto3.resource:
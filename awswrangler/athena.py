@@ -18,6 +18,7 @@ from awswrangler import _data_types, _utils, catalog, exceptions, s3, sts
 _logger: logging.Logger = logging.getLogger(__name__)
 
 _QUERY_WAIT_POLLING_DELAY: float = 0.2  # SECONDS
+_QUERY_WAIT_POLLING_DELAY_INITIAL: float = 0.05  # SECONDS
 
 
 def get_query_columns_types(query_execution_id: str, boto3_session: Optional[boto3.Session] = None) -> Dict[str, str]:
@@ -73,10 +74,7 @@ def create_athena_bucket(boto3_session: Optional[boto3.Session] = None) -> str:
     session: boto3.Session = _utils.ensure_session(session=boto3_session)
     account_id: str = sts.get_account_id(boto3_session=session)
     region_name: str = str(session.region_name).lower()
-    s3_output = f"s3://aws-athena-query-results-{account_id}-{region_name}/"
-    s3_resource = session.resource("s3")
-    s3_resource.Bucket(s3_output)
-    return s3_output
+    return f"s3://aws-athena-query-results-{account_id}-{region_name}/"
 
 
 def start_query_execution(
@@ -220,8 +218,10 @@ def wait_query(query_execution_id: str, boto3_session: Optional[boto3.Session] =
     client_athena: boto3.client = _utils.client(service_name="athena", session=boto3_session)
     response: Dict[str, Any] = client_athena.get_query_execution(QueryExecutionId=query_execution_id)
     state: str = response["QueryExecution"]["Status"]["State"]
+    delay: float = _QUERY_WAIT_POLLING_DELAY_INITIAL
     while state not in final_states:
-        time.sleep(_QUERY_WAIT_POLLING_DELAY)
+        time.sleep(delay)
+        delay = min(delay * 1.5, _QUERY_WAIT_POLLING_DELAY)
         response = client_athena.get_query_execution(QueryExecutionId=query_execution_id)
         state = response["QueryExecution"]["Status"]["State"]
     _logger.debug("state: %s", state)
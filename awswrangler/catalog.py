@@ -1,11 +1,12 @@
 """AWS Glue Catalog Module."""
 # pylint: disable=redefined-outer-name
 
+import functools
 import itertools
 import logging
 import re
 import unicodedata
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple, Union
 from urllib.parse import quote_plus as _quote_plus
 
 import boto3  # type: ignore
@@ -16,6 +17,9 @@ from awswrangler import _data_types, _utils, exceptions
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+_NON_ALPHANUMERIC_RE: Pattern = re.compile("[^A-Za-z0-9_]+")
+_CAMEL_CASE_RE: Pattern = re.compile("([a-z0-9])([A-Z])")
+
 
 def create_database(
     name: str,
@@ -128,6 +132,45 @@ def delete_table_if_exists(database: str, table: str, boto3_session: Optional[bo
         return False
 
 
+def delete_tables_if_exists(
+    database: str, tables: List[str], boto3_session: Optional[boto3.Session] = None
+) -> List[str]:
+    """Delete Glue tables if exist using batched requests (Up to 100 tables per request).
+
+    Parameters
+    ----------
+    database : str
+        Database name.
+    tables : List[str]
+        Tables names.
+    boto3_session : boto3.Session(), optional
+        Boto3 Session. The default boto3 session will be used if boto3_session receive None.
+
+    Returns
+    -------
+    List[str]
+        Tables names that were deleted.
+
+    Examples
+    --------
+    >>> import awswrangler as wr
+    >>> wr.catalog.delete_tables_if_exists(database='default', tables=['my_table', 'my_table2'])  # deleted
+    ['my_table', 'my_table2']
+    >>> wr.catalog.delete_tables_if_exists(database='default', tables=['my_table', 'my_table2'])  # Nothing deleted
+    []
+
+    """
+    client_glue: boto3.client = _utils.client(service_name="glue", session=boto3_session)
+    not_found: List[str] = []
+    for chunk in _utils.chunkify(lst=tables, max_length=100):
+        res: Dict[str, Any] = client_glue.batch_delete_table(DatabaseName=database, TablesToDelete=chunk)
+        for error in res.get("Errors", []):
+            if error["ErrorDetail"]["ErrorCode"] != "EntityNotFoundException":  # pragma: no cover
+                raise exceptions.ServiceApiError(res["Errors"])
+            not_found.append(error["TableName"])
+    return [t for t in tables if t not in not_found]
+
+
 def does_table_exist(database: str, table: str, boto3_session: Optional[boto3.Session] = None):
     """Check if the table exists.
 
@@ -579,7 +622,7 @@ def get_tables(
     if database is not None:
         dbs: List[str] = [database]
     else:
-        dbs = [x["Name"] for x in get_databases(catalog_id=catalog_id)]
+        dbs = [x["Name"] for x in get_databases(catalog_id=catalog_id, boto3_session=boto3_session)]
     for db in dbs:
         args["DatabaseName"] = db
         response_iterator = paginator.paginate(**args)
@@ -793,10 +836,11 @@ def table(
     return pd.DataFrame(data=df_dict)
 
 
+@functools.lru_cache(maxsize=4096)
 def _sanitize_name(name: str) -> str:
     name = "".join(c for c in unicodedata.normalize("NFD", name) if unicodedata.category(c) != "Mn")  # strip accents
-    name = re.sub("[^A-Za-z0-9_]+", "_", name)  # Replacing non alphanumeric characters by underscore
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()  # Converting CamelCase to snake_case
+    name = _NON_ALPHANUMERIC_RE.sub("_", name)  # Replacing non alphanumeric characters by underscore
+    return _CAMEL_CASE_RE.sub(r"\1_\2", name).lower()  # Converting CamelCase to snake_case
 
 
 def sanitize_column_name(column: str) -> str:
@@ -1237,10 +1281,10 @@ def _create_table(  # pylint: disable=too-many-branches,too-many-statements
         )
         client_glue.update_table(DatabaseName=database, TableInput=table_input, SkipArchive=skip_archive)
     elif (table_exist is True) and (mode in ("append", "overwrite_partitions", "update")):
-        if parameters is not None:
-            upsert_table_parameters(parameters=parameters, database=database, table=table, boto3_session=session)
-        if mode == "update":
+        if mode == "update":  # table_input already came from the catalog with the parameters merged in
             client_glue.update_table(DatabaseName=database, TableInput=table_input, SkipArchive=skip_archive)
+        elif parameters is not None:
+            upsert_table_parameters(parameters=parameters, database=database, table=table, boto3_session=session)
     elif table_exist is False:
         client_glue.create_table(DatabaseName=database, TableInput=table_input)
 
@@ -1747,13 +1791,16 @@ def upsert_table_parameters(
 
     """
     session: boto3.Session = _utils.ensure_session(session=boto3_session)
-    pars: Dict[str, str] = get_table_parameters(
+    table_input: Optional[Dict[str, Any]] = _get_table_input(
         database=database, table=table, catalog_id=catalog_id, boto3_session=session
     )
+    if table_input is None:
+        raise exceptions.InvalidTable(f"Table {table} does not exist on database {database}.")
+    pars: Dict[str, str] = table_input.get("Parameters", {})
     for k, v in parameters.items():
         pars[k] = v
-    overwrite_table_parameters(
-        parameters=pars, database=database, table=table, catalog_id=catalog_id, boto3_session=session
+    _overwrite_table_parameters(
+        parameters=pars, database=database, catalog_id=catalog_id, table_input=table_input, boto3_session=session
     )
     return pars
 
@@ -1801,13 +1848,25 @@ def overwrite_table_parameters(
     )
     if table_input is None:
         raise exceptions.InvalidTable(f"Table {table} does not exist on database {database}.")
+    return _overwrite_table_parameters(
+        parameters=parameters, database=database, catalog_id=catalog_id, table_input=table_input, boto3_session=session
+    )
+
+
+def _overwrite_table_parameters(
+    parameters: Dict[str, str],
+    database: str,
+    catalog_id: Optional[str],
+    table_input: Dict[str, Any],
+    boto3_session: Optional[boto3.Session],
+) -> Dict[str, str]:
     table_input["Parameters"] = parameters
     args2: Dict[str, Union[str, Dict[str, Any]]] = {}
     if catalog_id is not None:
         args2["CatalogId"] = catalog_id  # pragma: no cover
     args2["DatabaseName"] = database
     args2["TableInput"] = table_input
-    client_glue: boto3.client = _utils.client(service_name="glue", session=session)
+    client_glue: boto3.client = _utils.client(service_name="glue", session=boto3_session)
     client_glue.update_table(**args2)
     return parameters
 
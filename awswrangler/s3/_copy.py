@@ -1,5 +1,7 @@
 """Amazon S3 Copy Module (PRIVATE)."""
 
+import concurrent.futures
+import itertools
 import logging
 from typing import Dict, List, Optional, Tuple
 
@@ -13,21 +15,38 @@ from awswrangler.s3._list import list_objects
 _logger: logging.Logger = logging.getLogger(__name__)
 
 
+def _copy_object(source: str, target: str, use_threads: bool, client_s3: boto3.client) -> None:
+    source_bucket, source_key = _utils.parse_path(path=source)
+    copy_source: Dict[str, str] = {"Bucket": source_bucket, "Key": source_key}
+    target_bucket, target_key = _utils.parse_path(path=target)
+    client_s3.copy(
+        CopySource=copy_source,
+        Bucket=target_bucket,
+        Key=target_key,
+        SourceClient=client_s3,
+        Config=TransferConfig(num_download_attempts=15, use_threads=use_threads),
+    )
+
+
 def _copy_objects(batch: List[Tuple[str, str]], use_threads: bool, boto3_session: boto3.Session) -> None:
     _logger.debug("len(batch): %s", len(batch))
-    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
-    resource_s3: boto3.resource = _utils.resource(service_name="s3", session=boto3_session)
-    for source, target in batch:
-        source_bucket, source_key = _utils.parse_path(path=source)
-        copy_source: Dict[str, str] = {"Bucket": source_bucket, "Key": source_key}
-        target_bucket, target_key = _utils.parse_path(path=target)
-        resource_s3.meta.client.copy(
-            CopySource=copy_source,
-            Bucket=target_bucket,
-            Key=target_key,
-            SourceClient=client_s3,
-            Config=TransferConfig(num_download_attempts=15, use_threads=use_threads),
-        )
+    if (use_threads is False) or (len(batch) == 1):
+        client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
+        for source, target in batch:
+            _copy_object(source=source, target=target, use_threads=use_threads, client_s3=client_s3)
+    else:
+        cpus: int = min(_utils.ensure_cpu_count(use_threads=use_threads), len(batch))
+        client_s3 = _utils.client(service_name="s3", session=boto3_session, max_pool_connections=max(cpus, 10))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
+            list(
+                executor.map(
+                    _copy_object,
+                    [source for source, _ in batch],
+                    [target for _, target in batch],
+                    itertools.repeat(False),  # The outer pool already uses the client's connections
+                    itertools.repeat(client_s3),
+                )
+            )
 
 
 def merge_datasets(
@@ -79,6 +98,8 @@ def merge_datasets(
     ["s3://bucket1/dir1/key0", "s3://bucket1/dir1/key1"]
 
     """
+    if mode not in ("append", "overwrite", "overwrite_partitions"):
+        raise exceptions.InvalidArgumentValue(f"{mode} is a invalid mode option.")
     source_path = source_path[:-1] if source_path[-1] == "/" else source_path
     target_path = target_path[:-1] if target_path[-1] == "/" else target_path
     session: boto3.Session = _utils.ensure_session(session=boto3_session)
@@ -99,8 +120,6 @@ def merge_datasets(
         for path in target_partitions_paths:
             _logger.debug("Deleting to overwrite_partitions: %s", path)
             delete_objects(path=path, use_threads=use_threads, boto3_session=session)
-    elif mode != "append":
-        raise exceptions.InvalidArgumentValue(f"{mode} is a invalid mode option.")
 
     new_objects: List[str] = copy_objects(
         paths=paths, source_path=source_path, target_path=target_path, use_threads=use_threads, boto3_session=session
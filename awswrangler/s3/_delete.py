@@ -1,10 +1,10 @@
-"""Amazon S3 CopDeletey Module (PRIVATE)."""
+"""Amazon S3 Delete Module (PRIVATE)."""
 
 import concurrent.futures
 import datetime
 import itertools
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import boto3  # type: ignore
 
@@ -29,11 +29,7 @@ def _split_paths_by_bucket(paths: List[str]) -> Dict[str, List[str]]:
 def _delete_objects(bucket: str, keys: List[str], client_s3: boto3.client) -> None:
     _logger.debug("len(keys): %s", len(keys))
     batch: List[Dict[str, str]] = [{"Key": key} for key in keys]
-    res = client_s3.delete_objects(Bucket=bucket, Delete={"Objects": batch})
-    deleted = res.get("Deleted")
-    if deleted is not None:
-        for i in deleted:
-            _logger.debug("s3://%s/%s has been deleted.", bucket, i.get("Key"))
+    res = client_s3.delete_objects(Bucket=bucket, Delete={"Objects": batch, "Quiet": True})
     errors = res.get("Errors")
     if errors is not None:  # pragma: no cover
         raise exceptions.ServiceApiError(errors)
@@ -92,14 +88,24 @@ def delete_objects(
     )
     if len(paths) < 1:
         return
-    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
     buckets: Dict[str, List[str]] = _split_paths_by_bucket(paths=paths)
-    for bucket, keys in buckets.items():
-        chunks: List[List[str]] = _utils.chunkify(lst=keys, max_length=1_000)
-        if use_threads is False:
-            for chunk in chunks:
-                _delete_objects(bucket=bucket, keys=chunk, client_s3=client_s3)
-        else:
-            cpus: int = _utils.ensure_cpu_count(use_threads=use_threads)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
-                list(executor.map(_delete_objects, itertools.repeat(bucket), chunks, itertools.repeat(client_s3)))
+    batches: List[Tuple[str, List[str]]] = [
+        (bucket, chunk) for bucket, keys in buckets.items() for chunk in _utils.chunkify(lst=keys, max_length=1_000)
+    ]
+    client_s3: boto3.client
+    if (use_threads is False) or (len(batches) == 1):
+        client_s3 = _utils.client(service_name="s3", session=boto3_session)
+        for bucket, chunk in batches:
+            _delete_objects(bucket=bucket, keys=chunk, client_s3=client_s3)
+    else:
+        cpus: int = min(_utils.ensure_cpu_count(use_threads=use_threads), len(batches))
+        client_s3 = _utils.client(service_name="s3", session=boto3_session, max_pool_connections=max(cpus, 10))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
+            list(
+                executor.map(
+                    _delete_objects,
+                    [bucket for bucket, _ in batches],
+                    [chunk for _, chunk in batches],
+                    itertools.repeat(client_s3),
+                )
+            )
@@ -1,9 +1,12 @@
 """Amazon S3 Read Module (PRIVATE)."""
 
+import collections
 import concurrent.futures
 import datetime
 import itertools
 import logging
+import math
+import threading
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import boto3  # type: ignore
@@ -20,6 +23,11 @@ from awswrangler.s3._list import path2list
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+_TEXT_MIN_PARSER_CHUNKSIZE: int = 1024  # ROWS
+_PARQUET_METADATA_CACHE_SIZE: int = 1024
+_PARQUET_METADATA_CACHE: "collections.OrderedDict[Tuple[str, str], Dict[str, str]]" = collections.OrderedDict()
+_PARQUET_METADATA_CACHE_LOCK: threading.Lock = threading.Lock()
+
 
 def read_parquet_metadata_internal(
     path: Union[str, List[str]],
@@ -47,10 +55,15 @@ def read_parquet_metadata_internal(
             paths = path
         else:  # pragma: no cover
             raise exceptions.InvalidArgumentType(f"Argument path must be str or List[str] instead of {type(path)}.")
-    schemas: List[Dict[str, str]] = [
-        _read_parquet_metadata_file(path=x, use_threads=use_threads, boto3_session=session)
-        for x in _utils.list_sampling(lst=paths, sampling=sampling)
-    ]
+    sampled_paths: List[str] = _utils.list_sampling(lst=paths, sampling=sampling)
+    fs: s3fs.S3FileSystem = _utils.get_fs(session=session)
+    schemas: List[Dict[str, str]]
+    if (use_threads is False) or (len(sampled_paths) < 2):
+        schemas = [_read_parquet_metadata_file(path=x, fs=fs) for x in sampled_paths]
+    else:
+        cpus: int = min(_utils.ensure_cpu_count(use_threads=use_threads), len(sampled_paths))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
+            schemas = list(executor.map(_read_parquet_metadata_file, sampled_paths, itertools.repeat(fs)))
     _logger.debug("schemas: %s", schemas)
     columns_types: Dict[str, str] = {}
     for schema in schemas:
@@ -162,6 +175,8 @@ def _read_text_chunksize(
     dataset: bool = False,
 ) -> Iterator[pd.DataFrame]:
     fs: s3fs.S3FileSystem = _utils.get_fs(session=boto3_session, s3_additional_kwargs=s3_additional_kwargs)
+    # Small chunks are parsed in bigger batches (multiple of chunksize) and sliced afterwards
+    parser_chunksize: int = chunksize * int(math.ceil(_TEXT_MIN_PARSER_CHUNKSIZE / chunksize))
     for path in paths:
         _logger.debug("path: %s", path)
         partitions: Dict[str, Any] = {}
@@ -171,12 +186,17 @@ def _read_text_chunksize(
             pandas_kwargs["compression"] = infer_compression(path, compression="infer")
         mode: str = "r" if pandas_kwargs.get("compression") is None else "rb"
         with fs.open(path, mode) as f:
-            reader: pandas.io.parsers.TextFileReader = parser_func(f, chunksize=chunksize, **pandas_kwargs)
+            reader: pandas.io.parsers.TextFileReader = parser_func(f, chunksize=parser_chunksize, **pandas_kwargs)
             for df in reader:
                 if dataset is True:
                     for column_name, value in partitions.items():
                         df[column_name] = value
-                yield df
+                if len(df.index) <= chunksize:
+                    yield df
+                else:
+                    for i in range(0, len(df.index), chunksize):
+                        end: int = i + chunksize
+                        yield df.iloc[i:end]
 
 
 def _read_text_full(
@@ -247,6 +267,15 @@ def _read_parquet_init(
     return data
 
 
+def _read_parquet_piece(
+    piece: pyarrow.parquet.ParquetDatasetPiece,
+    columns: Optional[List[str]],
+    partitions: pyarrow.parquet.ParquetPartitions,
+    use_threads: bool,
+) -> pa.Table:
+    return piece.read(columns=columns, use_threads=use_threads, partitions=partitions, use_pandas_metadata=False)
+
+
 def _read_parquet(
     data: pyarrow.parquet.ParquetDataset,
     columns: Optional[List[str]] = None,
@@ -255,14 +284,25 @@ def _read_parquet(
     use_threads: bool = True,
     validate_schema: bool = True,
 ) -> pd.DataFrame:
-    tables: List[pa.Table] = []
+    tables: List[pa.Table]
     _logger.debug("Reading pieces...")
-    for piece in data.pieces:
-        table: pa.Table = piece.read(
-            columns=columns, use_threads=use_threads, partitions=data.partitions, use_pandas_metadata=False
-        )
-        _logger.debug("Appending piece in the list...")
-        tables.append(table)
+    if (use_threads is False) or (len(data.pieces) < 2):
+        tables = [
+            _read_parquet_piece(piece=p, columns=columns, partitions=data.partitions, use_threads=use_threads)
+            for p in data.pieces
+        ]
+    else:
+        cpus: int = min(_utils.ensure_cpu_count(use_threads=use_threads), len(data.pieces))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
+            tables = list(
+                executor.map(
+                    _read_parquet_piece,
+                    data.pieces,
+                    itertools.repeat(columns),
+                    itertools.repeat(data.partitions),
+                    itertools.repeat(use_threads),
+                )
+            )
     promote: bool = not validate_schema
     _logger.debug("Concating pieces...")
     table = pa.lib.concat_tables(tables, promote=promote)
@@ -330,11 +370,23 @@ def _table2df(
     )
 
 
-def _read_parquet_metadata_file(path: str, use_threads: bool, boto3_session: boto3.Session) -> Dict[str, str]:
-    data: pyarrow.parquet.ParquetDataset = _read_parquet_init(
-        path=path, filters=None, dataset=False, use_threads=use_threads, boto3_session=boto3_session
-    )
-    return _data_types.athena_types_from_pyarrow_schema(schema=data.schema.to_arrow_schema(), partitions=None)[0]
+def _read_parquet_metadata_file(path: str, fs: s3fs.S3FileSystem) -> Dict[str, str]:
+    """Read the columns types from a Parquet footer, caching it by path and ETag."""
+    with fs.open(path, "rb") as f:
+        # s3fs already HEADs the object on open, so the ETag comes for free
+        cache_key: Tuple[str, str] = (path, f.details["ETag"])
+        with _PARQUET_METADATA_CACHE_LOCK:
+            if cache_key in _PARQUET_METADATA_CACHE:
+                _logger.debug("Parquet metadata cache hit: %s", path)
+                _PARQUET_METADATA_CACHE.move_to_end(cache_key)
+                return dict(_PARQUET_METADATA_CACHE[cache_key])
+        schema: pa.Schema = pyarrow.parquet.ParquetFile(f).schema.to_arrow_schema()
+    columns_types: Dict[str, str] = _data_types.athena_types_from_pyarrow_schema(schema=schema, partitions=None)[0]
+    with _PARQUET_METADATA_CACHE_LOCK:
+        _PARQUET_METADATA_CACHE[cache_key] = columns_types
+        if len(_PARQUET_METADATA_CACHE) > _PARQUET_METADATA_CACHE_SIZE:
+            _PARQUET_METADATA_CACHE.popitem(last=False)
+    return dict(columns_types)
 
 
 def read_csv(
@@ -25,14 +25,16 @@ def _wait_objects(
     _delay: int = int(delay) if isinstance(delay, float) else delay
     if len(paths) < 1:
         return None
-    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
     _paths: List[Tuple[str, str]] = [_utils.parse_path(path=p) for p in paths]
-    if use_threads is False:
+    client_s3: boto3.client
+    if (use_threads is False) or (len(_paths) == 1):
+        client_s3 = _utils.client(service_name="s3", session=boto3_session)
         waiter = client_s3.get_waiter(waiter_name)
         for bucket, key in _paths:
             waiter.wait(Bucket=bucket, Key=key, WaiterConfig={"Delay": _delay, "MaxAttempts": max_attempts})
     else:
-        cpus: int = _utils.ensure_cpu_count(use_threads=use_threads)
+        cpus: int = min(_utils.ensure_cpu_count(use_threads=use_threads), len(_paths))
+        client_s3 = _utils.client(service_name="s3", session=boto3_session, max_pool_connections=max(cpus, 10))
         with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
             list(
                 executor.map(
@@ -3,7 +3,7 @@
 import csv
 import logging
 import uuid
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import boto3  # type: ignore
 import pandas as pd  # type: ignore
@@ -119,6 +119,7 @@ def _to_parquet_dataset(
     mode: str,
     dtype: Dict[str, str],
     partition_cols: Optional[List[str]] = None,
+    use_dictionary: Optional[Union[bool, List[str]]] = None,
     boto3_session: Optional[boto3.Session] = None,
 ) -> Tuple[List[str], Dict[str, List[str]]]:
     paths: List[str] = []
@@ -138,7 +139,15 @@ def _to_parquet_dataset(
     if not partition_cols:
         file_path: str = f"{path}{uuid.uuid4().hex}{compression_ext}.parquet"
         _to_parquet_file(
-            df=df, schema=schema, path=file_path, index=index, compression=compression, cpus=cpus, fs=fs, dtype=dtype
+            df=df,
+            schema=schema,
+            path=file_path,
+            index=index,
+            compression=compression,
+            cpus=cpus,
+            fs=fs,
+            dtype=dtype,
+            use_dictionary=use_dictionary,
         )
         paths.append(file_path)
     else:
@@ -159,12 +168,39 @@ def _to_parquet_dataset(
                 cpus=cpus,
                 fs=fs,
                 dtype=dtype,
+                use_dictionary=use_dictionary,
             )
             paths.append(file_path)
             partitions_values[prefix] = [str(k) for k in keys]
     return paths, partitions_values
 
 
+def _get_leaf_columns(path: str, dtype: pa.DataType) -> Iterator[Tuple[str, pa.DataType]]:
+    """Yield the Parquet column path and type of every leaf under a (possibly nested) Arrow field."""
+    if pa.types.is_struct(dtype):
+        for child in dtype:
+            yield from _get_leaf_columns(path=f"{path}.{child.name}", dtype=child.type)
+    elif pa.types.is_map(dtype):
+        yield from _get_leaf_columns(path=f"{path}.key_value.key", dtype=dtype.key_type)
+        yield from _get_leaf_columns(path=f"{path}.key_value.value", dtype=dtype.item_type)
+    elif pa.types.is_list(dtype):
+        yield from _get_leaf_columns(path=f"{path}.list.{dtype.value_field.name}", dtype=dtype.value_type)
+    else:
+        yield path, dtype
+
+
+def _get_use_dictionary(schema: pa.Schema, use_dictionary: Optional[Union[bool, List[str]]]) -> Union[bool, List[str]]:
+    if use_dictionary is not None:
+        return use_dictionary
+    # Only strings and categories tend to repeat values, elsewhere the dictionary page would only add overhead.
+    return [
+        path
+        for field in schema
+        for path, dtype in _get_leaf_columns(path=field.name, dtype=field.type)
+        if pa.types.is_string(dtype) or pa.types.is_large_string(dtype) or pa.types.is_dictionary(dtype)
+    ]
+
+
 def _to_parquet_file(
     df: pd.DataFrame,
     path: str,
@@ -174,12 +210,15 @@ def _to_parquet_file(
     cpus: int,
     fs: s3fs.S3FileSystem,
     dtype: Dict[str, str],
+    use_dictionary: Optional[Union[bool, List[str]]] = None,
 ) -> str:
     table: pa.Table = pyarrow.Table.from_pandas(df=df, schema=schema, nthreads=cpus, preserve_index=index, safe=True)
     for col_name, col_type in dtype.items():
         if col_name in table.column_names:
             col_index = table.column_names.index(col_name)
             pyarrow_dtype = _data_types.athena2pyarrow(col_type)
+            if table.schema.field(col_name).type == pyarrow_dtype:  # Already converted by from_pandas
+                continue
             field = pa.field(name=col_name, type=pyarrow_dtype)
             table = table.set_column(col_index, field, table.column(col_name).cast(pyarrow_dtype))
             _logger.debug("Casting column %s (%s) to %s (%s)", col_name, col_index, col_type, pyarrow_dtype)
@@ -187,7 +226,7 @@ def _to_parquet_file(
         table=table,
         where=path,
         write_statistics=True,
-        use_dictionary=True,
+        use_dictionary=_get_use_dictionary(schema=table.schema, use_dictionary=use_dictionary),
         filesystem=fs,
         coerce_timestamps="ms",
         compression=compression,
@@ -612,6 +651,7 @@ def to_parquet(  # pylint: disable=too-many-arguments,too-many-locals
     projection_values: Optional[Dict[str, str]] = None,
     projection_intervals: Optional[Dict[str, str]] = None,
     projection_digits: Optional[Dict[str, str]] = None,
+    use_dictionary: Optional[Union[bool, List[str]]] = None,
 ) -> Dict[str, Union[List[str], Dict[str, List[str]]]]:
     """Write Parquet file or dataset on Amazon S3.
 
@@ -706,6 +746,11 @@ def to_parquet(  # pylint: disable=too-many-arguments,too-many-locals
         Dictionary of partitions names and Athena projections digits.
         https://docs.aws.amazon.com/athena/latest/ug/partition-projection-supported-types.html
         (e.g. {'col_name': '1', 'col2_name': '2'})
+    use_dictionary : Union[bool, List[str]], optional
+        Forwarded to pyarrow.parquet.write_table(). True/False to enable/disable dictionary encoding
+        for all columns or a list of columns names to enable it only for those ones.
+        If None (Default), dictionary encoding is enabled only for string and categorical columns,
+        including the string fields nested inside struct/array/map columns.
 
     Returns
     -------
@@ -859,7 +904,15 @@ def to_parquet(  # pylint: disable=too-many-arguments,too-many-locals
         _logger.debug("schema: \n%s", schema)
         paths = [
             _to_parquet_file(
-                df=df, path=path, schema=schema, index=index, compression=compression, cpus=cpus, fs=fs, dtype=dtype
+                df=df,
+                path=path,
+                schema=schema,
+                index=index,
+                compression=compression,
+                cpus=cpus,
+                fs=fs,
+                dtype=dtype,
+                use_dictionary=use_dictionary,
             )
         ]
     else:
@@ -885,6 +938,7 @@ def to_parquet(  # pylint: disable=too-many-arguments,too-many-locals
             partition_cols=partition_cols,
             dtype=dtype,
             mode=mode,
+            use_dictionary=use_dictionary,
             boto3_session=session,
         )
         if (database is not None) and (table is not None):
@@ -1,5 +1,5 @@
+import functools
 import random
-import time
 from datetime import datetime
 from decimal import Decimal
 
@@ -14,7 +14,8 @@ dt = lambda x: datetime.strptime(x, "%Y-%m-%d").date()  # noqa
 CFN_VALID_STATUS = ["CREATE_COMPLETE", "ROLLBACK_COMPLETE", "UPDATE_COMPLETE", "UPDATE_ROLLBACK_COMPLETE"]
 
 
-def get_df():
+@functools.lru_cache(maxsize=None)
+def _build_df():
     df = pd.DataFrame(
         {
             "iint8": [1, None, 2],
@@ -45,7 +46,12 @@ def get_df():
     return df
 
 
-def get_df_list():
+def get_df():
+    return _build_df().copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_df_list():
     df = pd.DataFrame(
         {
             "iint8": [1, None, 2],
@@ -79,7 +85,12 @@ def get_df_list():
     return df
 
 
-def get_df_cast():
+def get_df_list():
+    return _build_df_list().copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_df_cast():
     df = pd.DataFrame(
         {
             "iint8": [None, None, None],
@@ -103,7 +114,12 @@ def get_df_cast():
     return df
 
 
-def get_df_csv():
+def get_df_cast():
+    return _build_df_cast().copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_df_csv():
     df = pd.DataFrame(
         {
             "id": [1, 2, 3],
@@ -124,7 +140,12 @@ def get_df_csv():
     return df
 
 
-def get_df_category():
+def get_df_csv():
+    return _build_df_csv().copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_df_category():
     df = pd.DataFrame(
         {
             "id": [1, 2, 3],
@@ -143,7 +164,12 @@ def get_df_category():
     return df
 
 
-def get_df_quicksight():
+def get_df_category():
+    return _build_df_category().copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _build_df_quicksight():
     df = pd.DataFrame(
         {
             "iint8": [1, None, 2],
@@ -173,6 +199,10 @@ def get_df_quicksight():
     return df
 
 
+def get_df_quicksight():
+    return _build_df_quicksight().copy()
+
+
 def get_query_long():
     return """
 SELECT
@@ -448,12 +478,7 @@ def get_time_str_with_random_suffix():
 def path_generator(bucket):
     s3_path = f"s3://{bucket}/{get_time_str_with_random_suffix()}/"
     print(f"S3 Path: {s3_path}")
-    time.sleep(1)
-    objs = wr.s3.list_objects(s3_path)
-    wr.s3.delete_objects(path=objs)
-    wr.s3.wait_objects_not_exist(objs)
     yield s3_path
-    time.sleep(1)
     objs = wr.s3.list_objects(s3_path)
     wr.s3.delete_objects(path=objs)
     wr.s3.wait_objects_not_exist(objs)
@@ -0,0 +1,47 @@
+import boto3
+import botocore.config
+import pytest
+
+BOTOCORE_CONFIG = botocore.config.Config(max_pool_connections=64, retries={"max_attempts": 10, "mode": "adaptive"})
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="Run the tests marked as slow.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: heavy Athena/CTAS test, only executed with --runslow.")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="Slow test, use --runslow to run it.")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def aws_session():
+    yield boto3.Session()
+
+
+@pytest.fixture(scope="session")
+def account_id(aws_session):
+    yield aws_session.client("sts", config=BOTOCORE_CONFIG).get_caller_identity().get("Account")
+
+
+@pytest.fixture(scope="session")
+def s3_client(aws_session):
+    yield aws_session.client("s3", config=BOTOCORE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def glue_client(aws_session):
+    yield aws_session.client("glue", config=BOTOCORE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def athena_client(aws_session):
+    yield aws_session.client("athena", config=BOTOCORE_CONFIG)
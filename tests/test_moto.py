@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest import mock
 from unittest.mock import ANY
 
@@ -5,6 +6,8 @@ import boto3
 import botocore
 import moto
 import pandas as pd
+import pyarrow
+import pyarrow.parquet
 import pytest
 from botocore.exceptions import ClientError
 
@@ -303,6 +306,30 @@ def test_parquet(s3):
     assert df.shape == (3, 19)
 
 
+def test_parquet_default_use_dictionary(s3):
+    path = "s3://bucket/test.parquet"
+    df = pd.DataFrame(
+        {
+            "c0": [1, 2, 1],
+            "c1": ["foo", "boo", "foo"],
+            "c2": [["foo"], ["boo"], ["foo"]],
+            "c3": [[1], [2], [1]],
+            "c4": [Decimal("1.1"), Decimal("2.2"), Decimal("1.1")],
+            "c5": [True, False, True],
+            "c6": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-01"]),
+            "c7": pd.Categorical(["foo", "boo", "foo"]),
+        }
+    )
+    wr.s3.to_parquet(df=df, path=path)
+    body = s3.Object("bucket", "test.parquet").get()["Body"].read()
+    metadata = pyarrow.parquet.ParquetFile(pyarrow.BufferReader(body)).metadata.row_group(0)
+    encodings = {metadata.column(i).path_in_schema: metadata.column(i).encodings for i in range(metadata.num_columns)}
+    for column in ("c0", "c3.list.item", "c4", "c5", "c6"):
+        assert "PLAIN_DICTIONARY" not in encodings[column]
+    for column in ("c1", "c2.list.item", "c7"):
+        assert "PLAIN_DICTIONARY" in encodings[column]
+
+
 def test_s3_delete_object_success(s3):
     path = "s3://bucket/test.parquet"
     wr.s3.to_parquet(df=get_df_list(), path=path, index=False, dataset=True, partition_cols=["par0", "par1"])
@@ -1,7 +1,7 @@
 import bz2
+import concurrent.futures
 import datetime
 import gzip
-import itertools
 import logging
 import lzma
 import math
@@ -12,7 +12,6 @@ from unittest.mock import patch
 import boto3
 import pandas as pd
 import pytest
-import pytz
 
 import awswrangler as wr
 
@@ -64,13 +63,15 @@ def kms_key(cloudformation_outputs):
 
 
 @pytest.fixture(scope="session")
-def workgroup0(bucket):
+def existing_workgroups(athena_client):
+    yield {x["Name"] for x in athena_client.list_work_groups()["WorkGroups"]}
+
+
+@pytest.fixture(scope="session")
+def workgroup0(bucket, athena_client, existing_workgroups):
     wkg_name = "aws_data_wrangler_0"
-    client = boto3.client("athena")
-    wkgs = client.list_work_groups()
-    wkgs = [x["Name"] for x in wkgs["WorkGroups"]]
-    if wkg_name not in wkgs:
-        client.create_work_group(
+    if wkg_name not in existing_workgroups:
+        athena_client.create_work_group(
             Name=wkg_name,
             Configuration={
                 "ResultConfiguration": {"OutputLocation": f"s3://{bucket}/athena_workgroup0/"},
@@ -85,13 +86,10 @@ def workgroup0(bucket):
 
 
 @pytest.fixture(scope="session")
-def workgroup1(bucket):
+def workgroup1(bucket, athena_client, existing_workgroups):
     wkg_name = "aws_data_wrangler_1"
-    client = boto3.client("athena")
-    wkgs = client.list_work_groups()
-    wkgs = [x["Name"] for x in wkgs["WorkGroups"]]
-    if wkg_name not in wkgs:
-        client.create_work_group(
+    if wkg_name not in existing_workgroups:
+        athena_client.create_work_group(
             Name=wkg_name,
             Configuration={
                 "ResultConfiguration": {
@@ -109,13 +107,10 @@ def workgroup1(bucket):
 
 
 @pytest.fixture(scope="session")
-def workgroup2(bucket, kms_key):
+def workgroup2(bucket, kms_key, athena_client, existing_workgroups):
     wkg_name = "aws_data_wrangler_2"
-    client = boto3.client("athena")
-    wkgs = client.list_work_groups()
-    wkgs = [x["Name"] for x in wkgs["WorkGroups"]]
-    if wkg_name not in wkgs:
-        client.create_work_group(
+    if wkg_name not in existing_workgroups:
+        athena_client.create_work_group(
             Name=wkg_name,
             Configuration={
                 "ResultConfiguration": {
@@ -133,13 +128,10 @@ def workgroup2(bucket, kms_key):
 
 
 @pytest.fixture(scope="session")
-def workgroup3(bucket, kms_key):
+def workgroup3(bucket, kms_key, athena_client, existing_workgroups):
     wkg_name = "aws_data_wrangler_3"
-    client = boto3.client("athena")
-    wkgs = client.list_work_groups()
-    wkgs = [x["Name"] for x in wkgs["WorkGroups"]]
-    if wkg_name not in wkgs:
-        client.create_work_group(
+    if wkg_name not in existing_workgroups:
+        athena_client.create_work_group(
             Name=wkg_name,
             Configuration={
                 "ResultConfiguration": {
@@ -160,7 +152,6 @@ def workgroup3(bucket, kms_key):
 def table(database):
     name = f"tbl_{get_time_str_with_random_suffix()}"
     print(f"Table name: {name}")
-    wr.catalog.delete_table_if_exists(database=database, table=name)
     yield name
     wr.catalog.delete_table_if_exists(database=database, table=name)
 
@@ -169,7 +160,6 @@ def table(database):
 def table2(database):
     name = f"tbl_{get_time_str_with_random_suffix()}"
     print(f"Table name: {name}")
-    wr.catalog.delete_table_if_exists(database=database, table=name)
     yield name
     wr.catalog.delete_table_if_exists(database=database, table=name)
 
@@ -189,11 +179,38 @@ def path3(bucket):
     yield from path_generator(bucket)
 
 
-def test_to_parquet_modes(database, table, path):
+def _assert_table(glue_client, database, table, description, parameters, columns_comments):
+    response = glue_client.get_table(DatabaseName=database, Name=table)["Table"]
+    assert len(response["Parameters"]) >= 5
+    for key, value in parameters.items():
+        assert response["Parameters"][key] == value
+    assert response.get("Description") == description
+    columns = response["StorageDescriptor"]["Columns"] + response.get("PartitionKeys", [])
+    assert {c["Name"]: c.get("Comment") for c in columns} == columns_comments
+
+
+def _read_sql_table_and_assert_table(glue_client, database, table, description, parameters, columns_comments):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future_df = executor.submit(wr.athena.read_sql_table, table, database)
+        _assert_table(glue_client, database, table, description, parameters, columns_comments)
+    return future_df.result()
+
+
+_DF_R1 = pd.DataFrame({"c0": pd.array([0, None], dtype="Int64")})
+_DF_R2 = pd.DataFrame({"c1": pd.array([None, 1, None], dtype="Int16")})
+_DF_R3 = pd.DataFrame({"c1": pd.array([None, 2, None], dtype="Int8")})
+_DF_R4 = pd.DataFrame({"c2": ["a", None, "b"], "c1": [None, None, None]})
+_DF_R5 = pd.DataFrame({"c2": [1], "c3": [True], "c1": ["1"]})
+_DF_R6 = pd.DataFrame({"c0": ["foo", None], "c1": [0, 1]})
+_DF_R7 = pd.DataFrame({"c0": [None, None], "c1": [0, 2]})
+_DF_R8 = pd.DataFrame({"c0": [1, 2], "c1": ["1", "3"], "c2": [True, False]})
+
+
+def test_to_parquet_modes(glue_client, database, table, path):
 
     # Round 1 - Warm up
-    df = pd.DataFrame({"c0": [0, None]}, dtype="Int64")
-    paths = wr.s3.to_parquet(
+    df = _DF_R1
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -203,23 +220,21 @@ def test_to_parquet_modes(database, table, path):
         description="c0",
         parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
         columns_comments={"c0": "0"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0",
+        parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
+        columns_comments={"c0": "0"},
+    )
     assert df.shape == df2.shape
-    assert df.c0.sum() == df2.c0.sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == str(len(df2.columns))
-    assert parameters["num_rows"] == str(len(df2.index))
-    assert wr.catalog.get_table_description(database, table) == "c0"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "0"
+    assert df.dtypes.equals(df2.dtypes)
 
     # Round 2 - Overwrite
-    df = pd.DataFrame({"c1": [None, 1, None]}, dtype="Int16")
-    paths = wr.s3.to_parquet(
+    df = _DF_R2
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -229,23 +244,21 @@ def test_to_parquet_modes(database, table, path):
         description="c1",
         parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
         columns_comments={"c1": "1"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c1",
+        parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
+        columns_comments={"c1": "1"},
+    )
     assert df.shape == df2.shape
-    assert df.c1.sum() == df2.c1.sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == str(len(df2.columns))
-    assert parameters["num_rows"] == str(len(df2.index))
-    assert wr.catalog.get_table_description(database, table) == "c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c1"] == "1"
+    assert df.dtypes.equals(df2.dtypes)
 
     # Round 3 - Append
-    df = pd.DataFrame({"c1": [None, 2, None]}, dtype="Int8")
-    paths = wr.s3.to_parquet(
+    df = _DF_R3
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -255,24 +268,22 @@ def test_to_parquet_modes(database, table, path):
         description="c1",
         parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index) * 2)},
         columns_comments={"c1": "1"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c1",
+        parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index) * 2)},
+        columns_comments={"c1": "1"},
+    )
     assert len(df.columns) == len(df2.columns)
     assert len(df.index) * 2 == len(df2.index)
     assert df.c1.sum() + 1 == df2.c1.sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == str(len(df2.columns))
-    assert parameters["num_rows"] == str(len(df2.index))
-    assert wr.catalog.get_table_description(database, table) == "c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c1"] == "1"
 
     # Round 4 - Append + New Column
-    df = pd.DataFrame({"c2": ["a", None, "b"], "c1": [None, None, None]})
-    paths = wr.s3.to_parquet(
+    df = _DF_R4
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -282,25 +293,22 @@ def test_to_parquet_modes(database, table, path):
         description="c1+c2",
         parameters={"num_cols": "2", "num_rows": "9"},
         columns_comments={"c1": "1", "c2": "2"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c1+c2",
+        parameters={"num_cols": "2", "num_rows": "9"},
+        columns_comments={"c1": "1", "c2": "2"},
+    )
     assert len(df2.columns) == 2
     assert len(df2.index) == 9
     assert df2.c1.sum() == 3
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "2"
-    assert parameters["num_rows"] == "9"
-    assert wr.catalog.get_table_description(database, table) == "c1+c2"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c1"] == "1"
-    assert comments["c2"] == "2"
 
     # Round 5 - Append + New Column + Wrong Types
-    df = pd.DataFrame({"c2": [1], "c3": [True], "c1": ["1"]})
-    paths = wr.s3.to_parquet(
+    df = _DF_R5
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -310,26 +318,22 @@ def test_to_parquet_modes(database, table, path):
         description="c1+c2+c3",
         parameters={"num_cols": "3", "num_rows": "10"},
         columns_comments={"c1": "1!", "c2": "2!", "c3": "3"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c1+c2+c3",
+        parameters={"num_cols": "3", "num_rows": "10"},
+        columns_comments={"c1": "1!", "c2": "2!", "c3": "3"},
+    )
     assert len(df2.columns) == 3
     assert len(df2.index) == 10
     assert df2.c1.sum() == 4
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "3"
-    assert parameters["num_rows"] == "10"
-    assert wr.catalog.get_table_description(database, table) == "c1+c2+c3"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c1"] == "1!"
-    assert comments["c2"] == "2!"
-    assert comments["c3"] == "3"
 
     # Round 6 - Overwrite Partitioned
-    df = pd.DataFrame({"c0": ["foo", None], "c1": [0, 1]})
-    paths = wr.s3.to_parquet(
+    df = _DF_R6
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -340,24 +344,21 @@ def test_to_parquet_modes(database, table, path):
         description="c0+c1",
         parameters={"num_cols": "2", "num_rows": "2"},
         columns_comments={"c0": "zero", "c1": "one"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0+c1",
+        parameters={"num_cols": "2", "num_rows": "2"},
+        columns_comments={"c0": "zero", "c1": "one"},
+    )
     assert df.shape == df2.shape
     assert df.c1.sum() == df2.c1.sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "2"
-    assert parameters["num_rows"] == "2"
-    assert wr.catalog.get_table_description(database, table) == "c0+c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "zero"
-    assert comments["c1"] == "one"
 
     # Round 7 - Overwrite Partitions
-    df = pd.DataFrame({"c0": [None, None], "c1": [0, 2]})
-    paths = wr.s3.to_parquet(
+    df = _DF_R7
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -368,25 +369,22 @@ def test_to_parquet_modes(database, table, path):
         description="c0+c1",
         parameters={"num_cols": "2", "num_rows": "3"},
         columns_comments={"c0": "zero", "c1": "one"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0+c1",
+        parameters={"num_cols": "2", "num_rows": "3"},
+        columns_comments={"c0": "zero", "c1": "one"},
+    )
     assert len(df2.columns) == 2
     assert len(df2.index) == 3
     assert df2.c1.sum() == 3
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "2"
-    assert parameters["num_rows"] == "3"
-    assert wr.catalog.get_table_description(database, table) == "c0+c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "zero"
-    assert comments["c1"] == "one"
 
     # Round 8 - Overwrite Partitions + New Column + Wrong Type
-    df = pd.DataFrame({"c0": [1, 2], "c1": ["1", "3"], "c2": [True, False]})
-    paths = wr.s3.to_parquet(
+    df = _DF_R8
+    wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
@@ -397,30 +395,27 @@ def test_to_parquet_modes(database, table, path):
         description="c0+c1+c2",
         parameters={"num_cols": "3", "num_rows": "4"},
         columns_comments={"c0": "zero", "c1": "one", "c2": "two"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
+    )
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0+c1+c2",
+        parameters={"num_cols": "3", "num_rows": "4"},
+        columns_comments={"c0": "zero", "c1": "one", "c2": "two"},
+    )
     assert len(df2.columns) == 3
     assert len(df2.index) == 4
     assert df2.c1.sum() == 6
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "3"
-    assert parameters["num_rows"] == "4"
     assert wr.catalog.get_table_description(database, table) == "c0+c1+c2"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "zero"
-    assert comments["c1"] == "one"
-    assert comments["c2"] == "two"
+    assert wr.catalog.get_columns_comments(database, table) == {"c0": "zero", "c1": "one", "c2": "two"}
 
 
-def test_store_parquet_metadata_modes(database, table, path):
+def test_store_parquet_metadata_modes(glue_client, database, table, path):
 
     # Round 1 - Warm up
-    df = pd.DataFrame({"c0": [0, None]}, dtype="Int64")
-    paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite")["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
+    df = pd.DataFrame({"c0": pd.array([0, None], dtype="Int64")})
+    wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite")
     wr.s3.store_parquet_metadata(
         path=path,
         dataset=True,
@@ -431,22 +426,20 @@ def test_store_parquet_metadata_modes(database, table, path):
         parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
         columns_comments={"c0": "0"},
     )
-    df2 = wr.athena.read_sql_table(table, database)
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0",
+        parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
+        columns_comments={"c0": "0"},
+    )
     assert df.shape == df2.shape
     assert df.c0.sum() == df2.c0.sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == str(len(df2.columns))
-    assert parameters["num_rows"] == str(len(df2.index))
-    assert wr.catalog.get_table_description(database, table) == "c0"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "0"
 
     # Round 2 - Overwrite
-    df = pd.DataFrame({"c1": [None, 1, None]}, dtype="Int16")
-    paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite")["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
+    df = pd.DataFrame({"c1": pd.array([None, 1, None], dtype="Int16")})
+    wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite")
     wr.s3.store_parquet_metadata(
         path=path,
         dataset=True,
@@ -457,22 +450,20 @@ def test_store_parquet_metadata_modes(database, table, path):
         parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
         columns_comments={"c1": "1"},
     )
-    df2 = wr.athena.read_sql_table(table, database)
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c1",
+        parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index))},
+        columns_comments={"c1": "1"},
+    )
     assert df.shape == df2.shape
     assert df.c1.sum() == df2.c1.sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == str(len(df2.columns))
-    assert parameters["num_rows"] == str(len(df2.index))
-    assert wr.catalog.get_table_description(database, table) == "c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c1"] == "1"
 
     # Round 3 - Append
-    df = pd.DataFrame({"c1": [None, 2, None]}, dtype="Int16")
-    paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="append")["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
+    df = pd.DataFrame({"c1": pd.array([None, 2, None], dtype="Int16")})
+    wr.s3.to_parquet(df=df, path=path, dataset=True, mode="append")
     wr.s3.store_parquet_metadata(
         path=path,
         dataset=True,
@@ -483,24 +474,22 @@ def test_store_parquet_metadata_modes(database, table, path):
         parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index) * 2)},
         columns_comments={"c1": "1"},
     )
-    df2 = wr.athena.read_sql_table(table, database)
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c1",
+        parameters={"num_cols": str(len(df.columns)), "num_rows": str(len(df.index) * 2)},
+        columns_comments={"c1": "1"},
+    )
     assert len(df.columns) == len(df2.columns)
     assert len(df.index) * 2 == len(df2.index)
     assert df.c1.sum() + 1 == df2.c1.sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == str(len(df2.columns))
-    assert parameters["num_rows"] == str(len(df2.index))
-    assert wr.catalog.get_table_description(database, table) == "c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c1"] == "1"
 
     # Round 4 - Append + New Column
     df = pd.DataFrame({"c2": ["a", None, "b"], "c1": [None, 1, None]})
     df["c1"] = df["c1"].astype("Int16")
-    paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="append")["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
+    wr.s3.to_parquet(df=df, path=path, dataset=True, mode="append")
     wr.s3.store_parquet_metadata(
         path=path,
         dataset=True,
@@ -511,24 +500,21 @@ def test_store_parquet_metadata_modes(database, table, path):
         parameters={"num_cols": "2", "num_rows": "9"},
         columns_comments={"c1": "1", "c2": "2"},
     )
-    df2 = wr.athena.read_sql_table(table, database)
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c1+c2",
+        parameters={"num_cols": "2", "num_rows": "9"},
+        columns_comments={"c1": "1", "c2": "2"},
+    )
     assert len(df2.columns) == 2
     assert len(df2.index) == 9
     assert df2.c1.sum() == 4
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "2"
-    assert parameters["num_rows"] == "9"
-    assert wr.catalog.get_table_description(database, table) == "c1+c2"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c1"] == "1"
-    assert comments["c2"] == "2"
 
     # Round 5 - Overwrite Partitioned
     df = pd.DataFrame({"c0": ["foo", None], "c1": [0, 1]})
-    paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite", partition_cols=["c1"])["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
+    wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite", partition_cols=["c1"])
     wr.s3.store_parquet_metadata(
         path=path,
         dataset=True,
@@ -539,25 +525,20 @@ def test_store_parquet_metadata_modes(database, table, path):
         parameters={"num_cols": "2", "num_rows": "2"},
         columns_comments={"c0": "zero", "c1": "one"},
     )
-    df2 = wr.athena.read_sql_table(table, database)
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0+c1",
+        parameters={"num_cols": "2", "num_rows": "2"},
+        columns_comments={"c0": "zero", "c1": "one"},
+    )
     assert df.shape == df2.shape
     assert df.c1.sum() == df2.c1.astype(int).sum()
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "2"
-    assert parameters["num_rows"] == "2"
-    assert wr.catalog.get_table_description(database, table) == "c0+c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "zero"
-    assert comments["c1"] == "one"
 
     # Round 6 - Overwrite Partitions
     df = pd.DataFrame({"c0": [None, "boo"], "c1": [0, 2]})
-    paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite_partitions", partition_cols=["c1"])[
-        "paths"
-    ]
-    wr.s3.wait_objects_exist(paths=paths)
+    wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite_partitions", partition_cols=["c1"])
     wr.s3.store_parquet_metadata(
         path=path,
         dataset=True,
@@ -568,26 +549,21 @@ def test_store_parquet_metadata_modes(database, table, path):
         parameters={"num_cols": "2", "num_rows": "3"},
         columns_comments={"c0": "zero", "c1": "one"},
     )
-    df2 = wr.athena.read_sql_table(table, database)
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0+c1",
+        parameters={"num_cols": "2", "num_rows": "3"},
+        columns_comments={"c0": "zero", "c1": "one"},
+    )
     assert len(df2.columns) == 2
     assert len(df2.index) == 3
     assert df2.c1.astype(int).sum() == 3
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "2"
-    assert parameters["num_rows"] == "3"
-    assert wr.catalog.get_table_description(database, table) == "c0+c1"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "zero"
-    assert comments["c1"] == "one"
 
     # Round 7 - Overwrite Partitions + New Column
     df = pd.DataFrame({"c0": ["bar", None], "c1": [1, 3], "c2": [True, False]})
-    paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite_partitions", partition_cols=["c1"])[
-        "paths"
-    ]
-    wr.s3.wait_objects_exist(paths=paths)
+    wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite_partitions", partition_cols=["c1"])
     wr.s3.store_parquet_metadata(
         path=path,
         dataset=True,
@@ -598,23 +574,21 @@ def test_store_parquet_metadata_modes(database, table, path):
         parameters={"num_cols": "3", "num_rows": "4"},
         columns_comments={"c0": "zero", "c1": "one", "c2": "two"},
     )
-    df2 = wr.athena.read_sql_table(table, database)
+    df2 = _read_sql_table_and_assert_table(
+        glue_client,
+        database,
+        table,
+        description="c0+c1+c2",
+        parameters={"num_cols": "3", "num_rows": "4"},
+        columns_comments={"c0": "zero", "c1": "one", "c2": "two"},
+    )
     assert len(df2.columns) == 3
     assert len(df2.index) == 4
     assert df2.c1.astype(int).sum() == 6
-    parameters = wr.catalog.get_table_parameters(database, table)
-    assert len(parameters) >= 5
-    assert parameters["num_cols"] == "3"
-    assert parameters["num_rows"] == "4"
-    assert wr.catalog.get_table_description(database, table) == "c0+c1+c2"
-    comments = wr.catalog.get_columns_comments(database, table)
-    assert len(comments) == len(df.columns)
-    assert comments["c0"] == "zero"
-    assert comments["c1"] == "one"
-    assert comments["c2"] == "two"
 
 
-def test_athena_ctas(path, path2, path3, table, table2, database, kms_key):
+def test_athena_ctas(path, table, table2, database, kms_key):
+    path, path2, path3 = f"{path}a/", f"{path}b/", f"{path}c/"
     df = get_df_list()
     columns_types, partitions_types = wr.catalog.extract_athena_types(df=df, partition_cols=["par0", "par1"])
     assert len(columns_types) == 17
@@ -622,7 +596,7 @@ def test_athena_ctas(path, path2, path3, table, table2, database, kms_key):
     with pytest.raises(wr.exceptions.InvalidArgumentValue):
         wr.catalog.extract_athena_types(df=df, file_format="avro")
     paths = wr.s3.to_parquet(
-        df=get_df_list(),
+        df=df,
         path=path,
         index=True,
         use_threads=True,
@@ -658,7 +632,7 @@ def test_athena_ctas(path, path2, path3, table, table2, database, kms_key):
         sql=f"SELECT * FROM {table}",
         database=database,
         ctas_approach=True,
-        chunksize=1,
+        chunksize=3,
         keep_files=False,
         ctas_temp_table_name=table2,
         s3_output=path3,
@@ -689,8 +663,7 @@ def test_athena_ctas(path, path2, path3, table, table2, database, kms_key):
     assert len(wr.s3.list_objects(path=path3)) > 2
 
 
-def test_athena(path, database, kms_key, workgroup0, workgroup1):
-    wr.catalog.delete_table_if_exists(database=database, table="__test_athena")
+def test_athena(path, database, table, kms_key, workgroup0, workgroup1):
     paths = wr.s3.to_parquet(
         df=get_df(),
         path=path,
@@ -699,12 +672,12 @@ def test_athena(path, database, kms_key, workgroup0, workgroup1):
         dataset=True,
         mode="overwrite",
         database=database,
-        table="__test_athena",
+        table=table,
         partition_cols=["par0", "par1"],
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     dfs = wr.athena.read_sql_query(
-        sql="SELECT * FROM __test_athena",
+        sql=f"SELECT * FROM {table}",
         database=database,
         ctas_approach=False,
         chunksize=1,
@@ -716,73 +689,77 @@ def test_athena(path, database, kms_key, workgroup0, workgroup1):
     for df2 in dfs:
         ensure_data_types(df=df2)
     df = wr.athena.read_sql_query(
-        sql="SELECT * FROM __test_athena",
-        database=database,
-        ctas_approach=False,
-        workgroup=workgroup1,
-        keep_files=False,
+        sql=f"SELECT * FROM {table}", database=database, ctas_approach=False, workgroup=workgroup1, keep_files=False
     )
     assert len(df.index) == 3
     ensure_data_types(df=df)
-    wr.athena.repair_table(table="__test_athena", database=database)
-    wr.catalog.delete_table_if_exists(database=database, table="__test_athena")
+    wr.athena.repair_table(table=table, database=database)
 
 
-def test_csv(path):
-    session = boto3.Session()
+@pytest.fixture(scope="module")
+def csv_paths(bucket, aws_session):
+    path = f"s3://{bucket}/{get_time_str_with_random_suffix()}/"
+    print(f"S3 Path: {path}")
     df = pd.DataFrame({"id": [1, 2, 3]})
-    path0 = f"{path}test_csv0.csv"
-    path1 = f"{path}test_csv1.csv"
-    path2 = f"{path}test_csv2.csv"
-    wr.s3.to_csv(df=df, path=path0, index=False)
-    wr.s3.wait_objects_exist(paths=[path0])
-    assert wr.s3.does_object_exist(path=path0) is True
-    assert wr.s3.size_objects(path=[path0], use_threads=False)[path0] == 9
-    assert wr.s3.size_objects(path=[path0], use_threads=True)[path0] == 9
-    wr.s3.to_csv(df=df, path=path1, index=False, boto3_session=None)
-    wr.s3.wait_objects_exist(paths=[path1])
-    wr.s3.to_csv(df=df, path=path2, index=False, boto3_session=session)
-    wr.s3.wait_objects_exist(paths=[path2])
-    assert df.equals(wr.s3.read_csv(path=path0, use_threads=False))
-    assert df.equals(wr.s3.read_csv(path=path0, use_threads=True))
-    assert df.equals(wr.s3.read_csv(path=path0, use_threads=False, boto3_session=session))
-    assert df.equals(wr.s3.read_csv(path=path0, use_threads=True, boto3_session=session))
-    paths = [path0, path1, path2]
-    df2 = pd.concat(objs=[df, df, df], sort=False, ignore_index=True)
-    assert df2.equals(wr.s3.read_csv(path=paths, use_threads=False))
-    assert df2.equals(wr.s3.read_csv(path=paths, use_threads=True))
-    assert df2.equals(wr.s3.read_csv(path=paths, use_threads=False, boto3_session=session))
-    assert df2.equals(wr.s3.read_csv(path=paths, use_threads=True, boto3_session=session))
+    paths = [f"{path}test_csv0.csv", f"{path}test_csv1.csv", f"{path}test_csv2.csv"]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(wr.s3.to_csv, df=df, path=paths[0], index=False),
+            executor.submit(wr.s3.to_csv, df=df, path=paths[1], index=False, boto3_session=None),
+            executor.submit(wr.s3.to_csv, df=df, path=paths[2], index=False, boto3_session=aws_session),
+        ]
+    for future in futures:
+        future.result()
+    yield paths
+    wr.s3.delete_objects(path=paths, use_threads=False)
+    wr.s3.wait_objects_not_exist(paths=paths, use_threads=False)
+
+
+def test_csv(csv_paths, s3_client):
+    bucket, key = wr._utils.parse_path(csv_paths[0])
+    assert s3_client.head_object(Bucket=bucket, Key=key)["ContentLength"] == 9
     with pytest.raises(wr.exceptions.InvalidArgumentType):
         wr.s3.read_csv(path=1)
     with pytest.raises(wr.exceptions.InvalidArgument):
-        wr.s3.read_csv(path=paths, iterator=True)
-    wr.s3.delete_objects(path=paths, use_threads=False)
-    wr.s3.wait_objects_not_exist(paths=paths, use_threads=False)
+        wr.s3.read_csv(path=csv_paths, iterator=True)
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+@pytest.mark.parametrize("use_session", [True, False])
+def test_csv_read(csv_paths, aws_session, use_threads, use_session):
+    boto3_session = aws_session if use_session else None
+    df = pd.DataFrame({"id": [1, 2, 3]})
+    df2 = pd.concat(objs=[df, df, df], sort=False, ignore_index=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        future_file = executor.submit(
+            wr.s3.read_csv, path=csv_paths[0], use_threads=use_threads, boto3_session=boto3_session
+        )
+        future_files = executor.submit(
+            wr.s3.read_csv, path=csv_paths, use_threads=use_threads, boto3_session=boto3_session
+        )
+    assert df.equals(future_file.result())
+    assert df2.equals(future_files.result())
 
 
 def test_json(path):
     df0 = pd.DataFrame({"id": [1, 2, 3]})
     path0 = f"{path}test_json0.json"
     path1 = f"{path}test_json1.json"
-    wr.s3.to_json(df=df0, path=path0)
-    wr.s3.to_json(df=df0, path=path1)
-    wr.s3.wait_objects_exist(paths=[path0, path1], use_threads=False)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda p: wr.s3.to_json(df=df0, path=p), [path0, path1]))
     assert df0.equals(wr.s3.read_json(path=path0, use_threads=False))
     df1 = pd.concat(objs=[df0, df0], sort=False, ignore_index=True)
     assert df1.equals(wr.s3.read_json(path=[path0, path1], use_threads=True))
 
 
-def test_fwf(path):
+def test_fwf(path, s3_client):
     text = "1 Herfelingen27-12-18\n2   Lambusart14-06-18\n3Spormaggiore15-04-18"
-    client_s3 = boto3.client("s3")
     path0 = f"{path}0.txt"
-    bucket, key = wr._utils.parse_path(path0)
-    client_s3.put_object(Body=text, Bucket=bucket, Key=key)
+    bucket0, key0 = wr._utils.parse_path(path0)
+    s3_client.put_object(Body=text, Bucket=bucket0, Key=key0)
     path1 = f"{path}1.txt"
-    bucket, key = wr._utils.parse_path(path1)
-    client_s3.put_object(Body=text, Bucket=bucket, Key=key)
-    wr.s3.wait_objects_exist(paths=[path0, path1])
+    bucket1, key1 = wr._utils.parse_path(path1)
+    s3_client.copy_object(Bucket=bucket1, Key=key1, CopySource={"Bucket": bucket0, "Key": key0})
     df = wr.s3.read_fwf(path=path0, use_threads=False, widths=[1, 12, 8], names=["id", "name", "date"])
     assert len(df.index) == 3
     assert len(df.columns) == 3
@@ -793,19 +770,19 @@ def test_fwf(path):
 
 def test_list_by_last_modified_date(path):
     df = pd.DataFrame({"id": [1, 2, 3]})
-    path0 = f"s3://{path}0.json"
-    path1 = f"s3://{path}1.json"
+    path0 = f"{path}0.json"
+    path1 = f"{path}1.json"
 
-    begin_utc = pytz.utc.localize(datetime.datetime.utcnow())
-    time.sleep(2)
     wr.s3.to_json(df, path0)
-    time.sleep(2)
-    mid_utc = pytz.utc.localize(datetime.datetime.utcnow())
-    time.sleep(2)
+    time.sleep(1)  # LastModified has a one second resolution
     wr.s3.to_json(df, path1)
-    time.sleep(2)
-    end_utc = pytz.utc.localize(datetime.datetime.utcnow())
-    wr.s3.wait_objects_exist(paths=[path0, path1], use_threads=False)
+    objects = wr.s3.describe_objects(path=[path0, path1])
+    last_modified0 = objects[path0]["LastModified"]
+    last_modified1 = objects[path1]["LastModified"]
+    assert last_modified0 < last_modified1
+    begin_utc = last_modified0 - datetime.timedelta(seconds=1)
+    mid_utc = last_modified0 + (last_modified1 - last_modified0) / 2
+    end_utc = last_modified1 + datetime.timedelta(seconds=1)
 
     assert len(wr.s3.read_json(path).index) == 6
     assert len(wr.s3.read_json(path, last_modified_begin=mid_utc).index) == 3
@@ -926,8 +903,9 @@ def test_parquet_catalog(bucket, database):
     assert len(partitions_values) == 2
     wr.s3.delete_objects(path=f"s3://{bucket}/test_parquet_catalog/")
     wr.s3.delete_objects(path=f"s3://{bucket}/test_parquet_catalog2/")
-    assert wr.catalog.delete_table_if_exists(database=database, table="test_parquet_catalog") is True
-    assert wr.catalog.delete_table_if_exists(database=database, table="test_parquet_catalog2") is True
+    tables = ["test_parquet_catalog", "test_parquet_catalog2"]
+    assert wr.catalog.delete_tables_if_exists(database=database, tables=tables) == tables
+    assert wr.catalog.delete_tables_if_exists(database=database, tables=tables) == []
 
 
 def test_parquet_catalog_duplicated(path, table, database):
@@ -978,8 +956,7 @@ def test_parquet_catalog_casting(path, database):
     assert wr.catalog.delete_table_if_exists(database=database, table="__test_parquet_catalog_casting") is True
 
 
-def test_catalog(path, database, table):
-    account_id = boto3.client("sts").get_caller_identity().get("Account")
+def test_catalog(path, database, table, aws_session, account_id):
     assert wr.catalog.does_table_exist(database=database, table=table) is False
     wr.catalog.create_parquet_table(
         database=database,
@@ -1030,11 +1007,11 @@ def test_catalog(path, database, table):
     df_dbs = wr.catalog.databases()
     assert len(wr.catalog.databases(catalog_id=account_id)) == len(df_dbs)
     assert database in df_dbs["Database"].to_list()
-    tables = list(wr.catalog.get_tables())
+    tables = list(wr.catalog.get_tables(boto3_session=aws_session))
     assert len(tables) > 0
-    for tbl in tables:
-        if tbl["Name"] == table:
-            assert tbl["TableType"] == "EXTERNAL_TABLE"
+    test_tables = [tbl for tbl in tables if (tbl["DatabaseName"] == database) and (tbl["Name"] == table)]
+    assert len(test_tables) == 1
+    assert test_tables[0]["TableType"] == "EXTERNAL_TABLE"
     tables = list(wr.catalog.get_tables(database=database))
     assert len(tables) > 0
     for tbl in tables:
@@ -1046,19 +1023,19 @@ def test_catalog(path, database, table):
         if tbl["Name"] == table:
             assert tbl["TableType"] == "EXTERNAL_TABLE"
     # prefix
-    tables = list(wr.catalog.get_tables(name_prefix=table[:4], catalog_id=account_id))
+    tables = list(wr.catalog.get_tables(database=database, name_prefix=table[:4], catalog_id=account_id))
     assert len(tables) > 0
     for tbl in tables:
         if tbl["Name"] == table:
             assert tbl["TableType"] == "EXTERNAL_TABLE"
     # suffix
-    tables = list(wr.catalog.get_tables(name_suffix=table[-4:], catalog_id=account_id))
+    tables = list(wr.catalog.get_tables(database=database, name_suffix=table[-4:], catalog_id=account_id))
     assert len(tables) > 0
     for tbl in tables:
         if tbl["Name"] == table:
             assert tbl["TableType"] == "EXTERNAL_TABLE"
     # name_contains
-    tables = list(wr.catalog.get_tables(name_contains=table[4:-4], catalog_id=account_id))
+    tables = list(wr.catalog.get_tables(database=database, name_contains=table[4:-4], catalog_id=account_id))
     assert len(tables) > 0
     for tbl in tables:
         if tbl["Name"] == table:
@@ -1067,11 +1044,17 @@ def test_catalog(path, database, table):
     with pytest.raises(wr.exceptions.InvalidArgumentCombination):
         list(
             wr.catalog.get_tables(
-                name_prefix=table[0], name_contains=table[3], name_suffix=table[-1], catalog_id=account_id
+                database=database,
+                name_prefix=table[0],
+                name_contains=table[3],
+                name_suffix=table[-1],
+                catalog_id=account_id,
             )
         )
     # prefix & suffix
-    tables = list(wr.catalog.get_tables(name_prefix=table[0], name_suffix=table[-1], catalog_id=account_id))
+    tables = list(
+        wr.catalog.get_tables(database=database, name_prefix=table[0], name_suffix=table[-1], catalog_id=account_id)
+    )
     assert len(tables) > 0
     for tbl in tables:
         if tbl["Name"] == table:
@@ -1219,7 +1202,7 @@ def test_category(bucket, database):
         mode="overwrite",
         partition_cols=["par0", "par1"],
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths, use_threads=True)
     df2 = wr.s3.read_parquet(path=path, dataset=True, categories=[c for c in df.columns if c not in ["par0", "par1"]])
     ensure_data_types_category(df2)
     df2 = wr.athena.read_sql_query("SELECT * FROM test_category", database=database, categories=list(df.columns))
@@ -1252,7 +1235,7 @@ def test_parquet_validate_schema(path):
     df2 = pd.DataFrame({"id2": [1, 2, 3], "val": ["foo", "boo", "bar"]})
     path_file2 = f"{path}1.parquet"
     wr.s3.to_parquet(df=df2, path=path_file2)
-    wr.s3.wait_objects_exist(paths=[path_file2], use_threads=False)
+    wr.s3.wait_objects_exist(paths=[path_file2])
     df3 = wr.s3.read_parquet(path=path, validate_schema=False)
     assert len(df3.index) == 6
     assert len(df3.columns) == 3
@@ -1260,6 +1243,15 @@ def test_parquet_validate_schema(path):
         wr.s3.read_parquet(path=path, validate_schema=True)
 
 
+def test_parquet_metadata_overwritten_file(path):
+    path_file = f"{path}0.parquet"
+    wr.s3.to_parquet(df=pd.DataFrame({"c0": [1, 2, 3]}), path=path_file)
+    assert wr.s3.read_parquet_metadata(path=[path_file])[0] == {"c0": "bigint"}
+    assert wr.s3.read_parquet_metadata(path=[path_file])[0] == {"c0": "bigint"}
+    wr.s3.to_parquet(df=pd.DataFrame({"c0": ["foo", "boo"], "c1": [1.0, 2.0]}), path=path_file)
+    assert wr.s3.read_parquet_metadata(path=[path_file])[0] == {"c0": "string", "c1": "double"}
+
+
 def test_csv_dataset(path, database):
     with pytest.raises(wr.exceptions.UndetectedType):
         wr.s3.to_csv(pd.DataFrame({"A": [None]}), path, dataset=True, database=database, table="test_csv_dataset")
@@ -1332,7 +1324,7 @@ def test_csv_catalog_columns(bucket, database):
         sep="|",
         columns=["id", "date", "timestamp", "par0", "par1"],
         index=False,
-        use_threads=False,
+        use_threads=True,
         boto3_session=None,
         s3_additional_kwargs=None,
         dataset=True,
@@ -1341,7 +1333,7 @@ def test_csv_catalog_columns(bucket, database):
         table="test_csv_catalog_columns",
         database=database,
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
+    wr.s3.wait_objects_exist(paths=paths, use_threads=True)
     df2 = wr.athena.read_sql_table("test_csv_catalog_columns", database)
     assert len(df2.index) == 3
     assert len(df2.columns) == 5
@@ -1353,7 +1345,7 @@ def test_csv_catalog_columns(bucket, database):
         path=path,
         sep="|",
         index=False,
-        use_threads=False,
+        use_threads=True,
         boto3_session=None,
         s3_additional_kwargs=None,
         dataset=True,
@@ -1362,7 +1354,7 @@ def test_csv_catalog_columns(bucket, database):
         table="test_csv_catalog_columns",
         database=database,
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
+    wr.s3.wait_objects_exist(paths=paths, use_threads=True)
     df2 = wr.athena.read_sql_table("test_csv_catalog_columns", database)
     assert len(df2.index) == 3
     assert len(df2.columns) == 5
@@ -1461,59 +1453,38 @@ def test_parquet_catalog_columns(bucket, database):
 
 @pytest.mark.parametrize("compression", [None, "gzip", "snappy"])
 def test_parquet_compress(bucket, database, compression):
-    path = f"s3://{bucket}/test_parquet_compress_{compression}/"
-    paths = wr.s3.to_parquet(
-        df=get_df(),
-        path=path,
-        compression=compression,
-        dataset=True,
-        database=database,
-        table=f"test_parquet_compress_{compression}",
-        mode="overwrite",
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths)
-    df2 = wr.athena.read_sql_table(f"test_parquet_compress_{compression}", database)
+    table = f"test_parquet_compress_{compression}"
+    path = f"s3://{bucket}/{table}/"
+    wr.s3.to_parquet(
+        df=get_df(), path=path, compression=compression, dataset=True, database=database, table=table, mode="overwrite"
+    )
+    df2 = wr.athena.read_sql_table(table, database)
     ensure_data_types(df2)
     df2 = wr.s3.read_parquet(path=path)
     wr.s3.delete_objects(path=path)
-    assert wr.catalog.delete_table_if_exists(database=database, table=f"test_parquet_compress_{compression}") is True
+    assert wr.catalog.delete_table_if_exists(database=database, table=table) is True
     ensure_data_types(df2)
 
 
 @pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
-def test_csv_compress(bucket, compression):
+def test_csv_compress(bucket, s3_client, compression):
     path = f"s3://{bucket}/test_csv_compress_{compression}/"
     wr.s3.delete_objects(path=path)
     df = get_df_csv()
+    buffer = BytesIO()
     if compression == "gzip":
-        buffer = BytesIO()
-        with gzip.GzipFile(mode="w", fileobj=buffer) as zipped_file:
-            df.to_csv(TextIOWrapper(zipped_file, "utf8"), index=False, header=None)
-        s3_resource = boto3.resource("s3")
-        s3_object = s3_resource.Object(bucket, f"test_csv_compress_{compression}/test.csv.gz")
-        s3_object.put(Body=buffer.getvalue())
-        file_path = f"s3://{bucket}/test_csv_compress_{compression}/test.csv.gz"
+        key = f"test_csv_compress_{compression}/test.csv.gz"
+        zipped_file = gzip.GzipFile(mode="w", fileobj=buffer, compresslevel=1)
     elif compression == "bz2":
-        buffer = BytesIO()
-        with bz2.BZ2File(mode="w", filename=buffer) as zipped_file:
-            df.to_csv(TextIOWrapper(zipped_file, "utf8"), index=False, header=None)
-        s3_resource = boto3.resource("s3")
-        s3_object = s3_resource.Object(bucket, f"test_csv_compress_{compression}/test.csv.bz2")
-        s3_object.put(Body=buffer.getvalue())
-        file_path = f"s3://{bucket}/test_csv_compress_{compression}/test.csv.bz2"
-    elif compression == "xz":
-        buffer = BytesIO()
-        with lzma.LZMAFile(mode="w", filename=buffer) as zipped_file:
-            df.to_csv(TextIOWrapper(zipped_file, "utf8"), index=False, header=None)
-        s3_resource = boto3.resource("s3")
-        s3_object = s3_resource.Object(bucket, f"test_csv_compress_{compression}/test.csv.xz")
-        s3_object.put(Body=buffer.getvalue())
-        file_path = f"s3://{bucket}/test_csv_compress_{compression}/test.csv.xz"
+        key = f"test_csv_compress_{compression}/test.csv.bz2"
+        zipped_file = bz2.BZ2File(mode="w", filename=buffer, compresslevel=1)
     else:
-        file_path = f"s3://{bucket}/test_csv_compress_{compression}/test.csv"
-        wr.s3.to_csv(df=df, path=file_path, index=False, header=None)
-
-    wr.s3.wait_objects_exist(paths=[file_path])
+        key = f"test_csv_compress_{compression}/test.csv.xz"
+        zipped_file = lzma.LZMAFile(mode="w", filename=buffer, preset=1)
+    with zipped_file:
+        df.to_csv(TextIOWrapper(zipped_file, "utf8"), index=False, header=None)
+    s3_client.put_object(Bucket=bucket, Key=key, Body=buffer.getvalue())
+    file_path = f"s3://{bucket}/{key}"
     df2 = wr.s3.read_csv(path=[file_path], names=df.columns)
     assert len(df2.index) == 3
     assert len(df2.columns) == 10
@@ -1563,13 +1534,13 @@ def test_merge(bucket):
     paths = wr.s3.to_parquet(df=df, path=path2, dataset=True, partition_cols=["par"], mode="overwrite")["paths"]
     wr.s3.wait_objects_exist(paths=paths)
     paths = wr.s3.merge_datasets(source_path=path2, target_path=path, mode="append", use_threads=True)
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.s3.read_parquet(path=path, dataset=True)
     assert df.id.sum() == 12
     assert df.par.astype("Int64").sum() == 12
 
     paths = wr.s3.merge_datasets(source_path=path2, target_path=path, mode="overwrite", use_threads=False)
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.s3.read_parquet(path=path, dataset=True)
     assert df.id.sum() == 6
     assert df.par.astype("Int64").sum() == 6
@@ -1578,7 +1549,7 @@ def test_merge(bucket):
     paths = wr.s3.to_parquet(df=df, path=path2, dataset=True, partition_cols=["par"], mode="overwrite")["paths"]
     wr.s3.wait_objects_exist(paths=paths)
     paths = wr.s3.merge_datasets(source_path=path2, target_path=path, mode="overwrite_partitions", use_threads=True)
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.s3.read_parquet(path=path, dataset=True)
     assert df.id.sum() == 7
     assert df.par.astype("Int64").sum() == 6
@@ -1606,7 +1577,7 @@ def test_copy(bucket):
     paths = wr.s3.to_parquet(df=df, path=path2, dataset=True, partition_cols=["par"], mode="overwrite")["paths"]
     wr.s3.wait_objects_exist(paths=paths)
     paths = wr.s3.copy_objects(paths, source_path=path2, target_path=path, use_threads=True)
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.s3.read_parquet(path=path, dataset=True)
     assert df.id.sum() == 12
     assert df.par.astype("Int64").sum() == 12
@@ -1618,11 +1589,8 @@ def test_copy(bucket):
 
 
 @pytest.mark.parametrize("col2", [[1, 1, 1, 1, 1], [1, 2, 3, 4, 5], [1, 1, 1, 1, 2], [1, 2, 2, 2, 2]])
-@pytest.mark.parametrize("chunked", [True, 1, 2, 100])
-def test_parquet_chunked(bucket, database, col2, chunked):
-    table = f"test_parquet_chunked_{chunked}_{''.join([str(x) for x in col2])}"
-    path = f"s3://{bucket}/{table}/"
-    wr.s3.delete_objects(path=path)
+def test_parquet_chunked(path, database, col2):
+    table = f"test_parquet_chunked_{''.join([str(x) for x in col2])}"
     values = list(range(5))
     df = pd.DataFrame({"col1": values, "col2": col2})
     paths = wr.s3.to_parquet(
@@ -1630,25 +1598,25 @@ def test_parquet_chunked(bucket, database, col2, chunked):
     )["paths"]
     wr.s3.wait_objects_exist(paths=paths)
 
-    dfs = list(wr.s3.read_parquet(path=path, dataset=True, chunked=chunked))
-    assert sum(values) == pd.concat(dfs, ignore_index=True).col1.sum()
-    if chunked is not True:
-        assert len(dfs) == int(math.ceil(len(df) / chunked))
-        for df2 in dfs[:-1]:
-            assert chunked == len(df2)
-        assert chunked >= len(dfs[-1])
-    else:
-        assert len(dfs) == len(set(col2))
-
-    dfs = list(wr.athena.read_sql_table(database=database, table=table, chunksize=chunked))
-    assert sum(values) == pd.concat(dfs, ignore_index=True).col1.sum()
-    if chunked is not True:
-        assert len(dfs) == int(math.ceil(len(df) / chunked))
-        for df2 in dfs[:-1]:
-            assert chunked == len(df2)
-        assert chunked >= len(dfs[-1])
+    for chunked in [True, 1, 2, 100]:
+        dfs = list(wr.s3.read_parquet(path=path, dataset=True, chunked=chunked))
+        assert sum(values) == sum(d.col1.sum() for d in dfs)
+        if chunked is not True:
+            assert len(dfs) == int(math.ceil(len(df) / chunked))
+            for df2 in dfs[:-1]:
+                assert chunked == len(df2)
+            assert chunked >= len(dfs[-1])
+        else:
+            assert len(dfs) == len(set(col2))
+
+        dfs = list(wr.athena.read_sql_table(database=database, table=table, chunksize=chunked))
+        assert sum(values) == sum(d.col1.sum() for d in dfs)
+        if chunked is not True:
+            assert len(dfs) == int(math.ceil(len(df) / chunked))
+            for df2 in dfs[:-1]:
+                assert chunked == len(df2)
+            assert chunked >= len(dfs[-1])
 
-    wr.s3.delete_objects(path=paths)
     assert wr.catalog.delete_table_if_exists(database=database, table=table) is True
 
 
@@ -1672,7 +1640,7 @@ def test_athena_encryption(
     paths = wr.s3.to_parquet(
         df=df, path=path, dataset=True, mode="overwrite", database=database, table=table, s3_additional_kwargs=None
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.athena.read_sql_table(
         table=table,
         ctas_approach=True,
@@ -1718,22 +1686,20 @@ def test_catalog_versioning(bucket, database):
     # Version 0
     df = pd.DataFrame({"c0": [1, 2]})
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, database=database, table=table, mode="overwrite")["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df = wr.athena.read_sql_table(table=table, database=database)
-    assert len(df.index) == 2
-    assert len(df.columns) == 1
-    assert str(df.c0.dtype).startswith("Int")
+    wr.s3.wait_objects_exist(paths=paths)
+    assert wr.catalog.get_table_types(database=database, table=table) == {"c0": "bigint"}
+    assert wr.s3.read_parquet_metadata(path=path)[0] == {"c0": "bigint"}
+    assert len(wr.s3.read_parquet(path=path).index) == 2
 
     # Version 1
     df = pd.DataFrame({"c1": ["foo", "boo"]})
     paths1 = wr.s3.to_parquet(
         df=df, path=path, dataset=True, database=database, table=table, mode="overwrite", catalog_versioning=True
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths1, use_threads=False)
-    df = wr.athena.read_sql_table(table=table, database=database)
-    assert len(df.index) == 2
-    assert len(df.columns) == 1
-    assert str(df.c1.dtype) == "string"
+    wr.s3.wait_objects_exist(paths=paths1)
+    assert wr.catalog.get_table_types(database=database, table=table) == {"c1": "string"}
+    assert wr.s3.read_parquet_metadata(path=path)[0] == {"c1": "string"}
+    assert len(wr.s3.read_parquet(path=path).index) == 2
 
     # Version 2
     df = pd.DataFrame({"c1": [1.0, 2.0]})
@@ -1747,12 +1713,10 @@ def test_catalog_versioning(bucket, database):
         catalog_versioning=True,
         index=False,
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths2, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths2)
     wr.s3.wait_objects_not_exist(paths=paths1, use_threads=False)
-    df = wr.athena.read_sql_table(table=table, database=database)
-    assert len(df.index) == 2
-    assert len(df.columns) == 1
-    assert str(df.c1.dtype).startswith("float")
+    assert wr.catalog.get_table_types(database=database, table=table) == {"c1": "double"}
+    assert len(wr.s3.read_csv(path=path, header=None).index) == 2
 
     # Version 3 (removing version 2)
     df = pd.DataFrame({"c1": [True, False]})
@@ -1766,7 +1730,7 @@ def test_catalog_versioning(bucket, database):
         catalog_versioning=False,
         index=False,
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths3, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths3)
     wr.s3.wait_objects_not_exist(paths=paths2, use_threads=False)
     df = wr.athena.read_sql_table(table=table, database=database)
     assert len(df.index) == 2
@@ -1784,13 +1748,13 @@ def test_copy_replacing_filename(bucket):
     df = pd.DataFrame({"c0": [1, 2]})
     file_path = f"{path}myfile.parquet"
     wr.s3.to_parquet(df=df, path=file_path)
-    wr.s3.wait_objects_exist(paths=[file_path], use_threads=False)
+    wr.s3.wait_objects_exist(paths=[file_path])
     path2 = f"s3://{bucket}/test_copy_replacing_filename2/"
     wr.s3.copy_objects(
         paths=[file_path], source_path=path, target_path=path2, replace_filenames={"myfile.parquet": "myfile2.parquet"}
     )
     expected_file = f"{path2}myfile2.parquet"
-    wr.s3.wait_objects_exist(paths=[expected_file], use_threads=False)
+    wr.s3.wait_objects_exist(paths=[expected_file])
     objs = wr.s3.list_objects(path=path2)
     assert objs[0] == expected_file
     wr.s3.delete_objects(path=path)
@@ -1806,7 +1770,7 @@ def test_unsigned_parquet(bucket, database):
     df["c1"] = df.c1.astype("uint16")
     df["c2"] = df.c2.astype("uint32")
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, database=database, table=table, mode="overwrite")["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.athena.read_sql_table(table=table, database=database)
     assert df.c0.sum() == (2 ** 8) - 1
     assert df.c1.sum() == (2 ** 16) - 1
@@ -1841,16 +1805,13 @@ def test_parquet_uint64(bucket):
             "c4": [0, 1, 2],
         }
     )
-    print(df)
     df["c0"] = df.c0.astype("uint8")
     df["c1"] = df.c1.astype("uint16")
     df["c2"] = df.c2.astype("uint32")
     df["c3"] = df.c3.astype("uint64")
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite", partition_cols=["c4"])["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.s3.read_parquet(path=path, dataset=True)
-    print(df)
-    print(df.dtypes)
     assert len(df.index) == 3
     assert len(df.columns) == 5
     assert df.c0.max() == (2 ** 8) - 1
@@ -1867,7 +1828,7 @@ def test_parquet_overwrite_partition_cols(path, database, table):
     paths = wr.s3.to_parquet(
         df=df, path=path, dataset=True, database=database, table=table, mode="overwrite", partition_cols=["c2"]
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.athena.read_sql_table(table=table, database=database)
     assert len(df.index) == 4
     assert len(df.columns) == 3
@@ -1878,7 +1839,7 @@ def test_parquet_overwrite_partition_cols(path, database, table):
     paths = wr.s3.to_parquet(
         df=df, path=path, dataset=True, database=database, table=table, mode="overwrite", partition_cols=["c1", "c2"]
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = wr.athena.read_sql_table(table=table, database=database)
     assert len(df.index) == 4
     assert len(df.columns) == 3
@@ -1951,7 +1912,7 @@ def test_metadata_partitions(path):
     path = f"{path}0.parquet"
     df = pd.DataFrame({"c0": [0, 1, 2], "c1": ["3", "4", "5"], "c2": [6.0, 7.0, 8.0]})
     paths = wr.s3.to_parquet(df=df, path=path, dataset=False)["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     columns_types, partitions_types = wr.s3.read_parquet_metadata(path=path, dataset=False)
     assert len(columns_types) == len(df.columns)
     assert columns_types.get("c0") == "bigint"
@@ -1960,7 +1921,7 @@ def test_metadata_partitions(path):
 
 
 def test_athena_cache(path, database, table, workgroup1):
-    df = pd.DataFrame({"c0": [0, None]}, dtype="Int64")
+    df = pd.DataFrame({"c0": pd.array([0, None], dtype="Int64")})
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite", database=database, table=table)["paths"]
     wr.s3.wait_objects_exist(paths=paths)
 
@@ -1979,7 +1940,7 @@ def test_athena_cache(path, database, table, workgroup1):
 
 
 def test_cache_query_ctas_approach_true(path, database, table):
-    df = pd.DataFrame({"c0": [0, None]}, dtype="Int64")
+    df = pd.DataFrame({"c0": pd.array([0, None], dtype="Int64")})
     paths = wr.s3.to_parquet(
         df=df,
         path=path,
@@ -2009,7 +1970,7 @@ def test_cache_query_ctas_approach_true(path, database, table):
 
 
 def test_cache_query_ctas_approach_false(path, database, table):
-    df = pd.DataFrame({"c0": [0, None]}, dtype="Int64")
+    df = pd.DataFrame({"c0": pd.array([0, None], dtype="Int64")})
     paths = wr.s3.to_parquet(
         df=df,
         path=path,
@@ -2039,7 +2000,7 @@ def test_cache_query_ctas_approach_false(path, database, table):
 
 
 def test_cache_query_semicolon(path, database, table):
-    df = pd.DataFrame({"c0": [0, None]}, dtype="Int64")
+    df = pd.DataFrame({"c0": pd.array([0, None], dtype="Int64")})
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, mode="overwrite", database=database, table=table)["paths"]
     wr.s3.wait_objects_exist(paths=paths)
 
@@ -2066,7 +2027,7 @@ def test_cache_query_semicolon(path, database, table):
 def test_metadata_partitions_dataset(path, partition_cols):
     df = pd.DataFrame({"c0": [0, 1, 2], "c1": [3, 4, 5], "c2": [6, 7, 8]})
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, partition_cols=partition_cols)["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     columns_types, partitions_types = wr.s3.read_parquet_metadata(path=path, dataset=True)
     partitions_types = partitions_types if partitions_types is not None else {}
     assert len(columns_types) + len(partitions_types) == len(df.columns)
@@ -2079,7 +2040,7 @@ def test_metadata_partitions_dataset(path, partition_cols):
 def test_store_metadata_partitions_dataset(database, table, path, partition_cols):
     df = pd.DataFrame({"c0": [0, 1, 2], "c1": [3, 4, 5], "c2": [6, 7, 8]})
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, partition_cols=partition_cols)["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     wr.s3.store_parquet_metadata(path=path, database=database, table=table, dataset=True)
     df2 = wr.athena.read_sql_table(table=table, database=database)
     assert len(df.index) == len(df2.index)
@@ -2089,12 +2050,18 @@ def test_store_metadata_partitions_dataset(database, table, path, partition_cols
     assert df.c2.sum() == df2.c2.astype(int).sum()
 
 
-def test_json_chunksize(path):
+def test_json_chunksize(path, s3_client):
     num_files = 10
     df = pd.DataFrame({"id": [1, 2, 3], "value": ["foo", "boo", "bar"]})
+    body = df.to_json(orient="records", lines=True).encode("utf-8")
     paths = [f"{path}{i}.json" for i in range(num_files)]
-    for p in paths:
-        wr.s3.to_json(df, p, orient="records", lines=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_files) as executor:
+        futures = [
+            executor.submit(s3_client.put_object, Bucket=bucket, Key=key, Body=body)
+            for bucket, key in (wr._utils.parse_path(p) for p in paths)
+        ]
+    for future in futures:
+        future.result()
     wr.s3.wait_objects_exist(paths)
     dfs = list(wr.s3.read_json(paths, lines=True, chunksize=1))
     assert len(dfs) == (3 * num_files)
@@ -2112,8 +2079,7 @@ def test_parquet_cast_string(path):
     df2 = wr.s3.read_parquet(path_file)
     assert str(df2.id.dtypes) == "string"
     assert df.shape == df2.shape
-    for col, row in tuple(itertools.product(df.columns, range(3))):
-        assert df[col].iloc[row] == df2[col].iloc[row]
+    pd.testing.assert_frame_equal(df.astype(str), df2.astype(str))
 
 
 @pytest.mark.parametrize("partition_cols", [None, ["c2"], ["value", "c2"]])
@@ -2127,17 +2093,20 @@ def test_parquet_cast_string_dataset(path, partition_cols):
     assert str(df2.id.dtypes) == "string"
     assert str(df2.c3.dtypes) == "string"
     assert df.shape == df2.shape
-    for col, row in tuple(itertools.product(df.columns, range(3))):
-        assert df[col].iloc[row] == df2[col].iloc[row]
+    pd.testing.assert_frame_equal(df.astype(str), df2[df.columns].astype(str))
 
 
 @pytest.mark.parametrize("partition_cols", [None, ["c2"], ["c1", "c2"]])
 def test_store_metadata_partitions_sample_dataset(database, table, path, partition_cols):
     num_files = 10
     df = pd.DataFrame({"c0": [0, 1, 2], "c1": [3, 4, 5], "c2": [6, 7, 8]})
-    for _ in range(num_files):
-        paths = wr.s3.to_parquet(df=df, path=path, dataset=True, partition_cols=partition_cols)["paths"]
-        wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_files) as executor:
+        futures = [
+            executor.submit(wr.s3.to_parquet, df=df, path=path, dataset=True, partition_cols=partition_cols)
+            for _ in range(num_files)
+        ]
+    paths = [p for future in futures for p in future.result()["paths"]]
+    wr.s3.wait_objects_exist(paths=paths)
     wr.s3.store_parquet_metadata(
         path=path, database=database, table=table, dtype={"c1": "bigint", "c2": "smallint"}, sampling=0.25, dataset=True
     )
@@ -2175,7 +2144,7 @@ def test_to_parquet_reverse_partitions(database, table, path, partition_cols):
     paths = wr.s3.to_parquet(
         df=df, path=path, dataset=True, database=database, table=table, partition_cols=partition_cols
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.athena.read_sql_table(table=table, database=database)
     assert df.shape == df2.shape
     assert df.c0.sum() == df2.c0.sum()
@@ -2195,12 +2164,12 @@ def test_to_parquet_nested_append(database, table, path):
         }
     )
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, database=database, table=table)["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.athena.read_sql_query(sql=f"SELECT c0, c1, c2, c4 FROM {table}", database=database)
     assert len(df2.index) == 2
     assert len(df2.columns) == 4
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, database=database, table=table)["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.athena.read_sql_query(sql=f"SELECT c0, c1, c2, c4 FROM {table}", database=database)
     assert len(df2.index) == 4
     assert len(df2.columns) == 4
@@ -2216,10 +2185,10 @@ def test_to_parquet_nested_cast(database, table, path):
         table=table,
         dtype={"c0": "array<double>", "c1": "array<string>", "c2": "struct<a:bigint, b:double>"},
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df = pd.DataFrame({"c0": [[1, 2, 3], [4, 5, 6]], "c1": [["a"], ["b"]], "c2": [{"a": 1, "b": 2}, {"a": 3, "b": 4}]})
     paths = wr.s3.to_parquet(df=df, path=path, dataset=True, database=database, table=table)["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.athena.read_sql_query(sql=f"SELECT c0, c2 FROM {table}", database=database)
     assert len(df2.index) == 4
     assert len(df2.columns) == 2
@@ -2258,79 +2227,72 @@ def test_to_parquet_file_dtype(path):
     assert str(df2.c1.dtype) == "string"
 
 
-def test_to_parquet_projection_integer(database, table, path):
-    df = pd.DataFrame({"c0": [0, 1, 2], "c1": [0, 1, 2], "c2": [0, 100, 200], "c3": [0, 1, 2]})
-    paths = wr.s3.to_parquet(
-        df=df,
-        path=path,
-        dataset=True,
-        database=database,
-        table=table,
-        partition_cols=["c1", "c2", "c3"],
-        regular_partitions=False,
-        projection_enabled=True,
-        projection_types={"c1": "integer", "c2": "integer", "c3": "integer"},
-        projection_ranges={"c1": "0,2", "c2": "0,200", "c3": "0,2"},
-        projection_intervals={"c2": "100"},
-        projection_digits={"c3": "1"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
-    assert df.shape == df2.shape
-    assert df.c0.sum() == df2.c0.sum()
-    assert df.c1.sum() == df2.c1.sum()
-    assert df.c2.sum() == df2.c2.sum()
-    assert df.c3.sum() == df2.c3.sum()
-
-
-def test_to_parquet_projection_enum(database, table, path):
-    df = pd.DataFrame({"c0": [0, 1, 2], "c1": [1, 2, 3], "c2": ["foo", "boo", "bar"]})
+@pytest.mark.parametrize(
+    "df,projection_kwargs,compare_cols",
+    [
+        pytest.param(
+            pd.DataFrame({"c0": [0, 1, 2], "c1": [0, 1, 2], "c2": [0, 100, 200], "c3": [0, 1, 2]}),
+            {
+                "partition_cols": ["c1", "c2", "c3"],
+                "projection_types": {"c1": "integer", "c2": "integer", "c3": "integer"},
+                "projection_ranges": {"c1": "0,2", "c2": "0,200", "c3": "0,2"},
+                "projection_intervals": {"c2": "100"},
+                "projection_digits": {"c3": "1"},
+            },
+            ["c0", "c1", "c2", "c3"],
+            id="integer",
+        ),
+        pytest.param(
+            pd.DataFrame({"c0": [0, 1, 2], "c1": [1, 2, 3], "c2": ["foo", "boo", "bar"]}),
+            {
+                "partition_cols": ["c1", "c2"],
+                "projection_types": {"c1": "enum", "c2": "enum"},
+                "projection_values": {"c1": "1,2,3", "c2": "foo,boo,bar"},
+            },
+            ["c0", "c1"],
+            id="enum",
+        ),
+        pytest.param(
+            pd.DataFrame(
+                {
+                    "c0": [0, 1, 2],
+                    "c1": [dt("2020-01-01"), dt("2020-01-02"), dt("2020-01-03")],
+                    "c2": [ts("2020-01-01 01:01:01.0"), ts("2020-01-01 01:01:02.0"), ts("2020-01-01 01:01:03.0")],
+                }
+            ),
+            {
+                "partition_cols": ["c1", "c2"],
+                "projection_types": {"c1": "date", "c2": "date"},
+                "projection_ranges": {"c1": "2020-01-01,2020-01-03", "c2": "2020-01-01 01:01:00,2020-01-01 01:01:03"},
+            },
+            ["c0"],
+            id="date",
+        ),
+    ],
+)
+@pytest.mark.slow
+def test_to_parquet_projection(database, table, path, df, projection_kwargs, compare_cols):
     paths = wr.s3.to_parquet(
         df=df,
         path=path,
         dataset=True,
         database=database,
         table=table,
-        partition_cols=["c1", "c2"],
         regular_partitions=False,
         projection_enabled=True,
-        projection_types={"c1": "enum", "c2": "enum"},
-        projection_values={"c1": "1,2,3", "c2": "foo,boo,bar"},
+        **projection_kwargs,
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.athena.read_sql_table(table, database)
     assert df.shape == df2.shape
-    assert df.c0.sum() == df2.c0.sum()
-    assert df.c1.sum() == df2.c1.sum()
-
-
-def test_to_parquet_projection_date(database, table, path):
-    df = pd.DataFrame(
-        {
-            "c0": [0, 1, 2],
-            "c1": [dt("2020-01-01"), dt("2020-01-02"), dt("2020-01-03")],
-            "c2": [ts("2020-01-01 01:01:01.0"), ts("2020-01-01 01:01:02.0"), ts("2020-01-01 01:01:03.0")],
-        }
+    pd.testing.assert_frame_equal(
+        df[compare_cols].sort_values("c0", ignore_index=True),
+        df2[compare_cols].sort_values("c0", ignore_index=True),
+        check_dtype=False,
     )
-    paths = wr.s3.to_parquet(
-        df=df,
-        path=path,
-        dataset=True,
-        database=database,
-        table=table,
-        partition_cols=["c1", "c2"],
-        regular_partitions=False,
-        projection_enabled=True,
-        projection_types={"c1": "date", "c2": "date"},
-        projection_ranges={"c1": "2020-01-01,2020-01-03", "c2": "2020-01-01 01:01:00,2020-01-01 01:01:03"},
-    )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
-    df2 = wr.athena.read_sql_table(table, database)
-    print(df2)
-    assert df.shape == df2.shape
-    assert df.c0.sum() == df2.c0.sum()
 
 
+@pytest.mark.slow
 def test_to_parquet_projection_injected(database, table, path):
     df = pd.DataFrame({"c0": [0, 1, 2], "c1": ["foo", "boo", "bar"], "c2": ["0", "1", "2"]})
     paths = wr.s3.to_parquet(
@@ -2344,7 +2306,7 @@ def test_to_parquet_projection_injected(database, table, path):
         projection_enabled=True,
         projection_types={"c1": "injected", "c2": "injected"},
     )["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.athena.read_sql_query(f"SELECT * FROM {table} WHERE c1='foo' AND c2='0'", database)
     assert df2.shape == (1, 3)
     assert df2.c0.iloc[0] == 0
@@ -2353,7 +2315,7 @@ def test_to_parquet_projection_injected(database, table, path):
 def test_read_parquet_filter_partitions(path):
     df = pd.DataFrame({"c0": [0, 1, 2], "c1": [0, 1, 2], "c2": [0, 0, 1]})
     paths = wr.s3.to_parquet(df, path, dataset=True, partition_cols=["c1", "c2"])["paths"]
-    wr.s3.wait_objects_exist(paths=paths, use_threads=False)
+    wr.s3.wait_objects_exist(paths=paths)
     df2 = wr.s3.read_parquet(path, dataset=True, filters=[("c1", "==", "0")])
     assert df2.shape == (1, 3)
     assert df2.c0.iloc[0] == 0
@@ -2371,14 +2333,22 @@ def test_read_parquet_filter_partitions(path):
     assert df2.c2.astype(int).sum() == 0
 
 
+_YEAR_MONTH_PARTITIONS = ((2020, 1), (2020, 2), (2021, 1))
+
+
 @pytest.mark.parametrize("use_threads", [True, False])
 @pytest.mark.parametrize("chunksize", [None, 1])
-def test_read_partitioned_json(path, use_threads, chunksize):
+def test_read_partitioned_json(path, s3_client, use_threads, chunksize):
     df = pd.DataFrame({"c0": [0, 1], "c1": ["foo", "boo"]})
-    paths = [f"{path}year={y}/month={m}/0.json" for y, m in [(2020, 1), (2020, 2), (2021, 1)]]
-    for p in paths:
-        wr.s3.to_json(df, p, orient="records", lines=True)
-    wr.s3.wait_objects_exist(paths, use_threads=False)
+    body = df.to_json(orient="records", lines=True).encode("utf-8")
+    bucket, prefix = wr._utils.parse_path(path)
+    keys = [f"{prefix}year={y}/month={m}/0.json" for y, m in _YEAR_MONTH_PARTITIONS]
+    paths = [f"s3://{bucket}/{key}" for key in keys]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        futures = [executor.submit(s3_client.put_object, Body=body, Bucket=bucket, Key=key) for key in keys]
+    for future in futures:
+        future.result()
+    wr.s3.wait_objects_exist(paths)
     df2 = wr.s3.read_json(path, dataset=True, use_threads=use_threads, chunksize=chunksize)
     if chunksize is None:
         assert df2.shape == (6, 4)
@@ -2390,12 +2360,17 @@ def test_read_partitioned_json(path, use_threads, chunksize):
 
 @pytest.mark.parametrize("use_threads", [True, False])
 @pytest.mark.parametrize("chunksize", [None, 1])
-def test_read_partitioned_csv(path, use_threads, chunksize):
+def test_read_partitioned_csv(path, s3_client, use_threads, chunksize):
     df = pd.DataFrame({"c0": [0, 1], "c1": ["foo", "boo"]})
-    paths = [f"{path}year={y}/month={m}/0.csv" for y, m in [(2020, 1), (2020, 2), (2021, 1)]]
-    for p in paths:
-        wr.s3.to_csv(df, p, index=False)
-    wr.s3.wait_objects_exist(paths, use_threads=False)
+    body = df.to_csv(index=False).encode("utf-8")
+    bucket, prefix = wr._utils.parse_path(path)
+    keys = [f"{prefix}year={y}/month={m}/0.csv" for y, m in _YEAR_MONTH_PARTITIONS]
+    paths = [f"s3://{bucket}/{key}" for key in keys]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        futures = [executor.submit(s3_client.put_object, Body=body, Bucket=bucket, Key=key) for key in keys]
+    for future in futures:
+        future.result()
+    wr.s3.wait_objects_exist(paths)
     df2 = wr.s3.read_csv(path, dataset=True, use_threads=use_threads, chunksize=chunksize)
     if chunksize is None:
         assert df2.shape == (6, 4)
@@ -2407,14 +2382,16 @@ def test_read_partitioned_csv(path, use_threads, chunksize):
 
 @pytest.mark.parametrize("use_threads", [True, False])
 @pytest.mark.parametrize("chunksize", [None, 1])
-def test_read_partitioned_fwf(path, use_threads, chunksize):
+def test_read_partitioned_fwf(path, s3_client, use_threads, chunksize):
     text = "0foo\n1boo"
-    client_s3 = boto3.client("s3")
-    paths = [f"{path}year={y}/month={m}/0.csv" for y, m in [(2020, 1), (2020, 2), (2021, 1)]]
-    for p in paths:
-        bucket, key = wr._utils.parse_path(p)
-        client_s3.put_object(Body=text, Bucket=bucket, Key=key)
-    wr.s3.wait_objects_exist(paths, use_threads=False)
+    bucket, prefix = wr._utils.parse_path(path)
+    keys = [f"{prefix}year={y}/month={m}/0.csv" for y, m in _YEAR_MONTH_PARTITIONS]
+    paths = [f"s3://{bucket}/{key}" for key in keys]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(keys)) as executor:
+        futures = [executor.submit(s3_client.put_object, Body=text, Bucket=bucket, Key=key) for key in keys]
+    for future in futures:
+        future.result()
+    wr.s3.wait_objects_exist(paths)
     df2 = wr.s3.read_fwf(
         path, dataset=True, use_threads=use_threads, chunksize=chunksize, widths=[1, 3], names=["c0", "c1"]
     )
@@ -2426,38 +2403,20 @@ def test_read_partitioned_fwf(path, use_threads, chunksize):
             assert d.shape == (1, 4)
 
 
-def test_glue_database():
+def test_glue_database(glue_client):
 
     # Round 1 - Create Database
     database_name = f"database_{get_time_str_with_random_suffix()}"
     print(f"Database Name: {database_name}")
     wr.catalog.create_database(name=database_name, description="Database Description")
-    databases = wr.catalog.get_databases()
-    test_database_name = ""
-    test_database_description = ""
-
-    for database in databases:
-        if database["Name"] == database_name:
-            test_database_name = database["Name"]
-            test_database_description = database["Description"]
-
-    assert test_database_name == database_name
-    assert test_database_description == "Database Description"
+    database = glue_client.get_database(Name=database_name)["Database"]
+    assert database["Name"] == database_name
+    assert database["Description"] == "Database Description"
 
     # Round 2 - Delete Database
-    print(f"Database Name: {database_name}")
     wr.catalog.delete_database(name=database_name)
-    databases = wr.catalog.get_databases()
-    test_database_name = ""
-    test_database_description = ""
-
-    for database in databases:
-        if database["Name"] == database_name:
-            test_database_name = database["Name"]
-            test_database_description = database["Description"]
-
-    assert test_database_name == ""
-    assert test_database_description == ""
+    with pytest.raises(glue_client.exceptions.EntityNotFoundException):
+        glue_client.get_database(Name=database_name)
 
 
 def test_list_wrong_path(path):
@@ -2477,7 +2436,7 @@ def test_sanitize_columns(path, sanitize_columns, col):
     df = wr.s3.read_parquet(file_path)
     assert len(df.index) == 3
     assert len(df.columns) == 1
-    assert df.columns == [col]
+    assert df.columns.tolist() == [col]
 
     # CSV
     file_path = f"{path}0.csv"
@@ -2486,48 +2445,53 @@ def test_sanitize_columns(path, sanitize_columns, col):
     df = wr.s3.read_csv(file_path)
     assert len(df.index) == 3
     assert len(df.columns) == 1
-    assert df.columns == [col]
+    assert df.columns.tolist() == [col]
 
 
-def test_parquet_catalog_casting_to_string(path, table, database):
-    for df in [get_df(), get_df_cast()]:
-        paths = wr.s3.to_parquet(
-            df=df,
-            path=path,
-            index=False,
-            dataset=True,
-            mode="overwrite",
-            database=database,
-            table=table,
-            dtype={
-                "iint8": "string",
-                "iint16": "string",
-                "iint32": "string",
-                "iint64": "string",
-                "float": "string",
-                "double": "string",
-                "decimal": "string",
-                "string": "string",
-                "date": "string",
-                "timestamp": "string",
-                "timestamp2": "string",
-                "bool": "string",
-                "binary": "string",
-                "category": "string",
-                "par0": "string",
-                "par1": "string",
-            },
-        )["paths"]
-        wr.s3.wait_objects_exist(paths=paths)
-        df = wr.s3.read_parquet(path=path)
-        assert df.shape == (3, 16)
-        for dtype in df.dtypes.values:
-            assert str(dtype) == "string"
-        df = wr.athena.read_sql_table(table=table, database=database, ctas_approach=True)
-        assert df.shape == (3, 16)
-        for dtype in df.dtypes.values:
-            assert str(dtype) == "string"
-        df = wr.athena.read_sql_table(table=table, database=database, ctas_approach=False)
-        assert df.shape == (3, 16)
-        for dtype in df.dtypes.values:
-            assert str(dtype) == "string"
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "get_df_func,check_athena", [(get_df, False), (get_df_cast, True)], ids=["get_df", "get_df_cast_athena"]
+)
+def test_parquet_catalog_casting_to_string(path, table, database, get_df_func, check_athena):
+    paths = wr.s3.to_parquet(
+        df=get_df_func(),
+        path=path,
+        index=False,
+        dataset=True,
+        mode="overwrite",
+        database=database,
+        table=table,
+        dtype={
+            "iint8": "string",
+            "iint16": "string",
+            "iint32": "string",
+            "iint64": "string",
+            "float": "string",
+            "double": "string",
+            "decimal": "string",
+            "string": "string",
+            "date": "string",
+            "timestamp": "string",
+            "timestamp2": "string",
+            "bool": "string",
+            "binary": "string",
+            "category": "string",
+            "par0": "string",
+            "par1": "string",
+        },
+    )["paths"]
+    wr.s3.wait_objects_exist(paths=paths)
+    df = wr.s3.read_parquet(path=path)
+    assert df.shape == (3, 16)
+    for dtype in df.dtypes.values:
+        assert str(dtype) == "string"
+    dtypes = wr.catalog.get_table_types(database=database, table=table)
+    assert len(dtypes) == 16
+    for dtype in dtypes.values():
+        assert dtype == "string"
+    if check_athena is True:
+        for ctas_approach in [True, False]:
+            df = wr.athena.read_sql_table(table=table, database=database, ctas_approach=ctas_approach)
+            assert df.shape == (3, 16)
+            for dtype in df.dtypes.values:
+                assert str(dtype) == "string"
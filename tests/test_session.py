@@ -18,3 +18,11 @@ def test_default_session():
     assert wr._utils.ensure_session().region_name == "us-west-1"
     boto3.setup_default_session(region_name="us-west-2")
     assert wr._utils.ensure_session().region_name == "us-west-2"
+
+
+def test_client_cache():
+    session = boto3.Session(region_name="us-east-1")
+    client = wr._utils.client(service_name="s3", session=session)
+    assert wr._utils.client(service_name="s3", session=session) is client
+    assert wr._utils.client(service_name="s3", session=boto3.Session(region_name="us-east-1")) is not client
+    assert wr._utils.client(service_name="glue", session=session) is not client